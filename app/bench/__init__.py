@@ -0,0 +1 @@
+"""오프라인 벤치마크 (네트워크/API 키 없이 합성 에셋으로 렌더러/텍스트 경로 측정)"""
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import json
+import os
+import platform
+import sys
+from importlib import metadata
+from pathlib import Path
+
+# settings(config_loader)는 OPENAI_API_KEY가 없으면 import 단계에서 실패한다 - 벤치마크는 API를 부르지 않는다
+OFFLINE_ENV = {"OPENAI_API_KEY": "offline-bench"}
+
+PACKAGES = ("numpy", "Pillow", "moviepy", "imageio", "imageio-ffmpeg")
+
+
+def prepare_offline_env() -> None:
+    """config.settings import 전에 호출 (이미 설정된 값은 그대로)"""
+    for key, value in OFFLINE_ENV.items():
+        os.environ.setdefault(key, value)
+
+
+def peak_rss_mb(children: bool = False) -> float:
+    """
+    peak RSS (MB).
+    - 현재 프로세스: Linux면 /proc/self/status의 VmHWM (ru_maxrss는 execve 전 부모 RSS까지 이어받아 spawn 자식에서 부풀려진다)
+    - children=True: 종료된 자식 프로세스(ffmpeg 등) 중 최댓값 ru_maxrss - 같은 이유로 fork한 쪽 RSS가 섞인 상한값
+    """
+    import resource
+
+    if not children:
+        try:
+            with open("/proc/self/status", encoding="ascii") as f:
+                for line in f:
+                    if line.startswith("VmHWM:"):
+                        return round(int(line.split()[1]) / 1024, 1)
+        except OSError:
+            pass
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF)
+    # Linux는 KB, macOS는 byte
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(usage.ru_maxrss / scale, 1)
+
+
+def environment_info() -> dict:
+    """결과 비교 시 업그레이드 여부를 알 수 있도록 인터프리터/주요 패키지 버전을 같이 남긴다"""
+    versions = {}
+    for name in PACKAGES:
+        try:
+            versions[name] = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            versions[name] = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "packages": versions,
+    }
+
+
+def load_json(path: str | Path) -> dict:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def write_json(path: str | Path, obj: dict) -> None:
+    # app 모듈은 prepare_offline_env() 이후에 import한다 (일부는 import 시점에 settings를 읽는다)
+    from app.utils.artifacts import save_json
+
+    save_json(Path(path), obj)
+
+
+def compare(
+    current: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    directions: dict[str, bool | None],
+    threshold: float,
+) -> list[dict]:
+    """
+    case별 지표를 기준선과 비교한다.
+    - directions: 지표 이름 -> True(클수록 좋음) / False(작을수록 좋음) / None(참고용, 판정 안 함)
+    - 나빠진 방향으로 threshold(비율) 넘게 바뀌면 regression=True
+    반환: [{case, metric, baseline, current, change, regression}] (기준선에 없는 case/지표는 제외)
+    """
+    rows: list[dict] = []
+    for case, values in current.items():
+        base = baseline.get(case)
+        if not base:
+            continue
+        for metric, higher_is_better in directions.items():
+            if metric not in values or metric not in base:
+                continue
+            b, c = float(base[metric]), float(values[metric])
+            change = (c - b) / b if b else 0.0
+            worse = -change if higher_is_better else change
+            rows.append(
+                {
+                    "case": case,
+                    "metric": metric,
+                    "baseline": b,
+                    "current": c,
+                    "change": round(change, 4),
+                    "regression": higher_is_better is not None and worse > threshold,
+                }
+            )
+    return rows
+
+
+def format_comparison(rows: list[dict]) -> str:
+    width = max([28] + [len(r["case"]) for r in rows])
+    lines = [f"{'case':<{width}} {'metric':<16} {'baseline':>12} {'current':>12} {'change':>8}"]
+    for r in rows:
+        flag = "  REGRESSION" if r["regression"] else ""
+        lines.append(
+            f"{r['case']:<{width}} {r['metric']:<16} {r['baseline']:>12.4g} {r['current']:>12.4g} "
+            f"{r['change'] * 100:>+7.1f}%{flag}"
+        )
+    return "\n".join(lines)
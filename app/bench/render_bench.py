@@ -0,0 +1,280 @@
+"""
+렌더러 벤치마크 (오프라인, API 키 불필요).
+
+합성 슬라이드 이미지 + 한/영 스크립트로 create_long_video / create_short_video / create_quote_short를
+고정된 설정에서 실행하고 wall time, 인코딩 frames/sec, peak RSS, 출력 크기를 JSON으로 남긴다.
+case(렌더러 x 엔진 x 반복)마다 새 프로세스에서 돌려서 peak RSS와 프로세스 전역 캐시가 서로 섞이지 않는다.
+
+    python -m app.bench.render_bench --duration 30 --resolution 1920x1080 --segments 12 --output bench.json
+    python -m app.bench.render_bench --engine pipe --engine moviepy --baseline bench.json --threshold 0.15
+"""
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from app.bench.common import (
+    compare,
+    environment_info,
+    format_comparison,
+    load_json,
+    peak_rss_mb,
+    prepare_offline_env,
+    write_json,
+)
+
+RENDERERS = ("long_video", "short_video", "quote_short")
+
+# 비교 지표: True = 클수록 좋음, False = 작을수록 좋음, None = 참고용
+DIRECTIONS = {
+    "wall_s": False,
+    "fps": True,
+    "peak_rss_mb": False,
+    "output_bytes": None,
+}
+
+
+def _parse_size(text: str) -> tuple[int, int]:
+    w, _, h = text.lower().partition("x")
+    return (int(w), int(h))
+
+
+def _make_bgm(path: Path, duration: float) -> Path:
+    """합성 BGM (사인파 mp3) - BGM 정규화/mux 경로까지 측정에 포함"""
+    from app.render.ffmpeg import _run, ffmpeg_binary
+
+    _run(
+        [
+            ffmpeg_binary(), "-y", "-loglevel", "error",
+            "-f", "lavfi", "-i", f"sine=frequency=220:duration={duration:.3f}",
+            "-c:a", "libmp3lame", str(path),
+        ],
+        "bench bgm",
+    )
+    return path
+
+
+def _apply_settings(spec: dict, work: Path) -> None:
+    from config import settings
+
+    long_w, long_h = spec["resolution"]
+    settings.OUTPUT_DIR = work / "output"
+    settings.OVERLAY_CACHE_DIR = work / "overlay_cache"
+    settings.BGM_CACHE_DIR = work / "bgm_cache"
+    settings.IMAGE_CACHE_DIR = work / "image_cache"
+    settings.IMAGE_SEARCH_CACHE_ENABLED = False
+    # 실행 간 디스크 캐시 재사용은 측정하지 않는다 (매 case 콜드 렌더)
+    settings.OVERLAY_CACHE_ENABLED = False
+    settings.RENDER_ENGINE = spec["engine"]
+    # 명언 숏츠는 기본이 QUOTE_RENDER_ENGINE(segments)이므로 case의 엔진으로 같이 맞춘다
+    settings.QUOTE_RENDER_ENGINE = spec["engine"]
+    settings.RENDER_WORKERS = spec["workers"]
+    settings.LONG_VIDEO_RESOLUTION = (long_w, long_h)
+    settings.SHORT_VIDEO_RESOLUTION = (long_h, long_w)
+    settings.LONG_DURATION_SEC = spec["duration"]
+    settings.SHORT_DURATION_SEC = spec["short_duration"]
+    if spec.get("font"):
+        settings.FONT_PATH = Path(spec["font"])
+    if spec.get("motion"):
+        settings.SLIDE_MOTION = spec["motion"]
+    if spec.get("transition"):
+        settings.SLIDE_TRANSITION = spec["transition"]
+    settings.BGM_PATH = Path(spec["bgm_path"]) if spec["bgm_path"] else work / "no_bgm.mp3"
+
+
+def _run_case(spec: dict) -> dict:
+    """(자식 프로세스) 렌더 1회 - 에셋은 부모가 미리 만들어 두므로 시간/메모리는 렌더만 측정"""
+    prepare_offline_env()
+    from app.render.metrics import METRICS_FILENAME
+
+    with tempfile.TemporaryDirectory(prefix="render_bench_") as tmp:
+        work = Path(tmp)
+        _apply_settings(spec, work)
+        run_dir = work / "run"
+        run_dir.mkdir()
+        out = run_dir / f"{spec['renderer']}.mp4"
+        assets = spec["assets"]
+
+        if spec["renderer"] == "long_video":
+            from app.video.video_creator import create_long_video
+
+            t0 = time.perf_counter()
+            create_long_video(
+                assets["long_script"], assets["images"], output_path=str(out), profile=spec["profile"], run_dir=run_dir
+            )
+        elif spec["renderer"] == "short_video":
+            from app.short.short_creator import create_short_video
+
+            t0 = time.perf_counter()
+            create_short_video(
+                assets["short_script"], assets["images"], output=str(out), profile=spec["profile"], run_dir=run_dir
+            )
+        else:
+            from app.short.quote_creator import create_quote_short
+
+            title, lines, units = assets["quote"]
+            t0 = time.perf_counter()
+            create_quote_short(
+                video_title=title,
+                quote_lines=lines,
+                typing_units=units,
+                output_path=str(out),
+                token_interval_sec=0.20,
+                hold_sec=1.5,
+                profile=spec["profile"],
+                run_dir=run_dir,
+            )
+        wall = time.perf_counter() - t0
+
+        metrics = load_json(run_dir / METRICS_FILENAME)[spec["renderer"]]
+        frames = int(metrics["counts"].get("frames_encoded", 0))
+        return {
+            "wall_s": round(wall, 4),
+            "frames": frames,
+            "fps": round(frames / wall, 2) if wall > 0 else 0.0,
+            "peak_rss_mb": peak_rss_mb(),
+            "peak_child_rss_mb": peak_rss_mb(children=True),
+            "output_bytes": int(metrics["counts"].get("output_bytes", 0)),
+            "phases_s": metrics["phases_s"],
+        }
+
+
+def _summarize(runs: list[dict]) -> dict:
+    """반복 결과: 시간은 최솟값(잡음이 가장 적음) + 중앙값, 메모리는 최댓값"""
+    best = min(runs, key=lambda r: r["wall_s"])
+    return {
+        "wall_s": best["wall_s"],
+        "wall_s_median": round(statistics.median(r["wall_s"] for r in runs), 4),
+        "frames": best["frames"],
+        "fps": best["fps"],
+        "peak_rss_mb": max(r["peak_rss_mb"] for r in runs),
+        "peak_child_rss_mb": max(r["peak_child_rss_mb"] for r in runs),
+        "output_bytes": best["output_bytes"],
+        "phases_s": best["phases_s"],
+        "repeat": len(runs),
+    }
+
+
+def _make_assets(args: argparse.Namespace, directory: Path) -> dict:
+    """모든 case가 공유하는 합성 입력 (seed 고정이라 실행마다 같다)"""
+    from app.bench import synthetic
+
+    seed = args.seed
+    return {
+        "images": synthetic.make_slide_images(directory / "images", args.images, _parse_size(args.image_size), seed),
+        "long_script": synthetic.make_script(args.segments, args.segment_chars, args.lang, seed),
+        "short_script": synthetic.make_hook_list(args.segments, args.segment_chars, args.lang, seed),
+        "quote": synthetic.make_quote(lang="en" if args.lang == "en" else "ko", seed=seed),
+    }
+
+
+def run_benchmark(args: argparse.Namespace) -> dict:
+    with tempfile.TemporaryDirectory(prefix="render_bench_assets_") as tmp:
+        assets_dir = Path(tmp)
+        assets = _make_assets(args, assets_dir)
+        bgm_path = None if args.no_bgm else str(_make_bgm(assets_dir / "bgm.mp3", args.duration))
+        return _run_cases(args, assets, bgm_path)
+
+
+def _run_cases(args: argparse.Namespace, assets: dict, bgm_path: str | None) -> dict:
+    base = {
+        "duration": args.duration,
+        "short_duration": args.short_duration,
+        "resolution": _parse_size(args.resolution),
+        "image_size": _parse_size(args.image_size),
+        "images": args.images,
+        "segments": args.segments,
+        "segment_chars": args.segment_chars,
+        "lang": args.lang,
+        "profile": args.profile,
+        "workers": args.workers,
+        "font": args.font,
+        "motion": args.motion,
+        "transition": args.transition,
+        "bgm": not args.no_bgm,
+        "seed": args.seed,
+    }
+    results: dict[str, dict] = {}
+    # spawn: 부모에서 import한 모듈/캐시를 물려받지 않는 깨끗한 프로세스
+    # (multiprocessing.Pool 워커는 daemon이라 RENDER_WORKERS > 1의 프로세스 풀을 못 띄운다)
+    ctx = multiprocessing.get_context("spawn")
+    for engine in args.engine:
+        for renderer in args.renderer:
+            case = f"{renderer}/{engine}"
+            spec = {**base, "renderer": renderer, "engine": engine, "assets": assets, "bgm_path": bgm_path}
+            runs = []
+            for _ in range(args.repeat):
+                with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                    runs.append(pool.submit(_run_case, spec).result())
+            results[case] = _summarize(runs)
+            print(f"{case}: wall={results[case]['wall_s']:.2f}s fps={results[case]['fps']:.1f} "
+                  f"rss={results[case]['peak_rss_mb']:.0f}MB bytes={results[case]['output_bytes']}", file=sys.stderr)
+    return {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "params": {**base, "engines": list(args.engine), "renderers": list(args.renderer), "repeat": args.repeat},
+        "environment": environment_info(),
+        "results": results,
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="offline render benchmark (synthetic assets)")
+    parser.add_argument("--renderer", action="append", choices=RENDERERS, help="반복 지정 가능 (기본: 전부)")
+    parser.add_argument("--engine", action="append", choices=("moviepy", "pipe", "segments"), help="반복 지정 가능 (기본: moviepy)")
+    parser.add_argument("--duration", type=int, default=30, help="롱폼 길이(초)")
+    parser.add_argument("--short-duration", type=int, default=10, help="숏츠/명언 숏츠 길이(초)")
+    parser.add_argument("--resolution", default="1920x1080", help="롱폼 해상도 WxH (숏츠는 세로로 뒤집어 사용)")
+    parser.add_argument("--image-size", default="1600x1200", help="합성 원본 이미지 크기 WxH")
+    parser.add_argument("--images", type=int, default=6, help="합성 슬라이드 이미지 수")
+    parser.add_argument("--segments", type=int, default=12, help="자막 세그먼트 수")
+    parser.add_argument("--segment-chars", type=int, default=40, help="세그먼트당 글자 수")
+    parser.add_argument("--lang", choices=("ko", "en", "mixed"), default="mixed")
+    parser.add_argument("--profile", default="publish", help="인코딩 프로파일 (draft/publish/archive)")
+    parser.add_argument("--workers", type=int, default=1, help="RENDER_WORKERS")
+    parser.add_argument("--font", default=None, help="FONT_PATH 덮어쓰기 (기본: settings.FONT_PATH)")
+    parser.add_argument("--motion", choices=("kenburns", "none"), default=None, help="SLIDE_MOTION 덮어쓰기")
+    parser.add_argument("--transition", choices=("crossfade", "wipe", "none"), default=None, help="SLIDE_TRANSITION 덮어쓰기")
+    parser.add_argument("--no-bgm", action="store_true", help="합성 BGM 없이 렌더")
+    parser.add_argument("--repeat", type=int, default=1, help="case당 반복 횟수 (시간은 최솟값 보고)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="결과 JSON 경로 (기준선으로 저장할 때도 사용)")
+    parser.add_argument("--baseline", help="비교할 기준선 JSON (이전 --output 결과)")
+    parser.add_argument("--threshold", type=float, default=0.15, help="회귀 판정 비율 (0.15 = 15%%)")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    prepare_offline_env()
+    args.renderer = args.renderer or list(RENDERERS)
+    args.engine = args.engine or ["moviepy"]
+    args.repeat = max(1, args.repeat)
+
+    report = run_benchmark(args)
+    if args.output:
+        write_json(Path(args.output), report)
+    else:
+        import json
+
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+
+    if not args.baseline:
+        return 0
+    rows = compare(report["results"], load_json(args.baseline)["results"], DIRECTIONS, args.threshold)
+    print(format_comparison(rows))
+    regressions = [r for r in rows if r["regression"]]
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+"""
+벤치마크 진입점 오프라인 점검: OPENAI_API_KEY 없이 각 모듈을 새 프로세스로 실행해 본다.
+(app 모듈이 import 시점에 settings를 읽으면 prepare_offline_env() 전에 config_loader가 실패한다)
+
+    python -m app.bench.selfcheck
+"""
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from app.bench.common import OFFLINE_ENV
+
+
+def _smoke_commands(work: Path) -> list[tuple[str, list[str]]]:
+    return [
+        ("render_bench --help", ["-m", "app.bench.render_bench", "--help"]),
+        ("text_bench --help", ["-m", "app.bench.text_bench", "--help"]),
+        # import + prepare_offline_env + settings + 결과 저장(artifacts)까지 실제로 한 번 돈다
+        (
+            "text_bench run",
+            [
+                "-m", "app.bench.text_bench",
+                "--case", "split_text", "--corpus-size", "1", "--rounds", "1", "--warmup", "0",
+                "--output", str(work / "text_bench.json"),
+            ],
+        ),
+    ]
+
+
+def main() -> int:
+    env = {k: v for k, v in os.environ.items() if k not in OFFLINE_ENV}
+    failed = 0
+    with tempfile.TemporaryDirectory(prefix="bench_selfcheck_") as tmp:
+        for name, args in _smoke_commands(Path(tmp)):
+            proc = subprocess.run([sys.executable, *args], env=env, capture_output=True, text=True)
+            ok = proc.returncode == 0
+            failed += not ok
+            print(f"{'ok  ' if ok else 'FAIL'} {name}")
+            if not ok:
+                print(proc.stderr.strip()[-2000:], file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+# 뉴스/썰 스크립트에 자주 나오는 어휘 (결과가 실제 자막 폭/줄바꿈 분포와 비슷하도록)
+KO_WORDS = (
+    "오늘", "서울", "경찰", "사건", "발생", "시민", "목격자", "조사", "결과", "발표",
+    "관계자", "밝혔다", "현장", "주민들", "충격", "이번", "사고로", "인근", "도로", "통제",
+    "확인됐다", "것으로", "전해졌다", "당국은", "원인을", "파악", "중이다", "피해", "규모", "추가",
+)
+EN_WORDS = (
+    "today", "police", "said", "the", "incident", "happened", "near", "downtown", "witnesses",
+    "reported", "a", "loud", "noise", "before", "officers", "arrived", "at", "scene", "and",
+    "closed", "road", "for", "hours", "investigation", "is", "ongoing", "according", "to", "officials",
+)
+
+
+def make_slide_images(directory: Path, count: int, size: tuple[int, int], seed: int = 0) -> list[str]:
+    """
+    사진처럼 디코드 비용이 드는 JPEG 슬라이드 count장 (그라디언트 + 도형 + 약한 노이즈, seed 고정).
+    반환: 파일 경로 목록 (로컬 경로라 다운로드 없이 create_* 에 그대로 넘긴다)
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    w, h = size
+    yy, xx = np.mgrid[0:h, 0:w].astype(np.float32)
+    paths: list[str] = []
+    for i in range(count):
+        c0, c1 = rng.integers(0, 256, 3), rng.integers(0, 256, 3)
+        t = (xx / max(1, w - 1) * 0.6 + yy / max(1, h - 1) * 0.4)[..., None]
+        arr = (c0 * (1 - t) + c1 * t).astype(np.uint8)
+        img = Image.fromarray(arr)
+        draw = ImageDraw.Draw(img)
+        for _ in range(12):
+            x0, y0 = int(rng.integers(0, w)), int(rng.integers(0, h))
+            x1, y1 = x0 + int(rng.integers(w // 20, w // 3)), y0 + int(rng.integers(h // 20, h // 3))
+            fill = tuple(int(v) for v in rng.integers(0, 256, 3))
+            if rng.random() < 0.5:
+                draw.ellipse((x0, y0, x1, y1), fill=fill)
+            else:
+                draw.rectangle((x0, y0, x1, y1), fill=fill)
+        noisy = np.asarray(img, dtype=np.int16) + rng.integers(-12, 13, (h, w, 3), dtype=np.int16)
+        path = directory / f"slide_{i:02d}.jpg"
+        Image.fromarray(np.clip(noisy, 0, 255).astype(np.uint8)).save(path, quality=90)
+        paths.append(str(path))
+    return paths
+
+
+def make_sentence(rng: random.Random, lang: str, chars: int) -> str:
+    """lang("ko" / "en" / "mixed") 어휘로 약 chars 글자 길이의 문장"""
+    if lang == "ko":
+        pools = (KO_WORDS,)
+    elif lang == "en":
+        pools = (EN_WORDS,)
+    elif lang == "mixed":
+        pools = (KO_WORDS, EN_WORDS)
+    else:
+        raise ValueError(f"unknown lang: {lang!r} (choices=('ko', 'en', 'mixed'))")
+    words: list[str] = []
+    length = 0
+    while not words or length + 1 + 4 <= chars:
+        word = rng.choice(rng.choice(pools))
+        words.append(word)
+        length += len(word) + (1 if len(words) > 1 else 0)
+    return " ".join(words)
+
+
+def make_script(segments: int, chars_per_segment: int = 40, lang: str = "mixed", seed: int = 0) -> str:
+    """롱폼 스크립트: 줄 하나 = 자막 세그먼트 하나 (chars_per_segment <= 48이면 split_text 결과와 개수가 같다)"""
+    rng = random.Random(seed)
+    return "\n".join(make_sentence(rng, lang, chars_per_segment) for _ in range(max(1, segments)))
+
+
+def make_hook_list(segments: int, chars_per_segment: int = 40, lang: str = "mixed", seed: int = 0) -> str:
+    """숏츠 스크립트: "1. ..." 번호 목록 (split_short_segments 입력 형태)"""
+    rng = random.Random(seed)
+    return "\n".join(f"{i + 1}. {make_sentence(rng, lang, chars_per_segment)}" for i in range(max(1, segments)))
+
+
+def make_quote(lines: int = 3, words_per_line: int = 4, lang: str = "ko", seed: int = 0) -> tuple[str, list[str], list[list[str]]]:
+    """명언 숏츠 입력 (video_title, quote_lines, typing_units) - 토큰 = 단어"""
+    rng = random.Random(seed)
+    pool = EN_WORDS if lang == "en" else KO_WORDS
+    units = [[rng.choice(pool) for _ in range(max(1, words_per_line))] for _ in range(max(1, lines))]
+    title = " ".join(rng.choice(pool) for _ in range(3))
+    return title, [" ".join(u) for u in units], units
+
+
+# 연출 지시문 (clean_stage_directions가 지우는 형태 + 남겨야 하는 괄호)
+_STAGE_DIRECTIONS = (
+    "[인트로]", "**[아웃트로]**", "(강렬한 음악과 함께)", "[효과음: 쾅]", "(화면 전환)",
+    "[BGM 페이드 아웃]", "(자막: 충격 실화)", "[컷]",
+)
+_KEPT_BRACKETS = ("(서울=연합뉴스)", "[단독]", "(30대 남성)", "(사진)")
+
+
+def make_text_corpus(size: int = 20, seed: int = 0) -> dict[str, list[str]]:
+    """
+    텍스트 레이아웃 마이크로 벤치마크 입력 (seed 고정).
+    - hangul_run: 공백 없는 긴 한글 (80~400자) - 폭 기준 하드 래핑 최악 경로
+    - mixed: 한/영/숫자 섞인 문장 (공백 있음)
+    - hook_list: "1. ..." 번호 목록 숏츠 스크립트 (따옴표로 감싼 줄 포함)
+    - stage_directions: 연출 지시문이 많은 롱폼 스크립트
+    """
+    rng = random.Random(seed)
+    size = max(1, size)
+    corpus: dict[str, list[str]] = {"hangul_run": [], "mixed": [], "hook_list": [], "stage_directions": []}
+    for _ in range(size):
+        target = rng.randint(80, 400)
+        run = ""
+        while len(run) < target:
+            run += rng.choice(KO_WORDS)
+        corpus["hangul_run"].append(run[:target])
+
+        parts = [make_sentence(rng, "mixed", rng.randint(30, 120)), f"{rng.randint(1, 9999)}명", rng.choice(EN_WORDS).upper()]
+        rng.shuffle(parts)
+        corpus["mixed"].append(", ".join(parts) + rng.choice((".", "!", "?", "…")))
+
+        hooks = []
+        for i in range(rng.randint(3, 6)):
+            line = make_sentence(rng, rng.choice(("ko", "mixed")), rng.randint(20, 70))
+            hooks.append(f'{i + 1}. "{line}"' if rng.random() < 0.3 else f"{i + 1}. {line}")
+        corpus["hook_list"].append("\n".join(hooks))
+
+        lines = []
+        for _ in range(rng.randint(8, 20)):
+            line = make_sentence(rng, "ko", rng.randint(20, 80))
+            if rng.random() < 0.5:
+                line = f"{rng.choice(_STAGE_DIRECTIONS)} {line}"
+            if rng.random() < 0.3:
+                line = f"{line} {rng.choice(_KEPT_BRACKETS)}"
+            if rng.random() < 0.15:
+                line = rng.choice(_STAGE_DIRECTIONS)
+            lines.append(line)
+        corpus["stage_directions"].append("\n\n".join(lines))
+    return corpus
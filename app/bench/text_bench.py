@@ -0,0 +1,169 @@
+"""
+텍스트 레이아웃 핫패스 마이크로 벤치마크 (오프라인).
+
+세그먼트마다 호출되는 자막 분할/래핑/렌더 함수들을 합성 코퍼스(긴 한글 연속, 한/영 혼합,
+번호 목록 훅, 연출 지시문 많은 스크립트)로 반복 호출해서 호출당 지연 퍼센타일(us)을 JSON으로 남긴다.
+--baseline을 주면 p50/p90이 --threshold 넘게 느려진 case를 회귀로 표시하고 종료 코드 1을 돌려준다.
+
+    python -m app.bench.text_bench --output text_bench.json
+    python -m app.bench.text_bench --baseline text_bench.json --threshold 0.2
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+from app.bench.common import compare, environment_info, format_comparison, load_json, prepare_offline_env, write_json
+
+# 비교 지표: False = 작을수록 좋음, None = 참고용 (꼬리 지연은 잡음이 커서 판정하지 않는다)
+DIRECTIONS = {
+    "p50_us": False,
+    "p90_us": False,
+    "p99_us": None,
+    "max_us": None,
+}
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = min(len(sorted_values) - 1, max(0, int(round(q * (len(sorted_values) - 1)))))
+    return sorted_values[k]
+
+
+def measure(fn: Callable[[str], object], inputs: list[str], *, rounds: int, warmup: int) -> dict:
+    """inputs를 rounds번 돌며 호출 1회씩 시간을 잰다 (warmup 라운드는 폰트/글리프 캐시 예열용으로 버림)"""
+    for _ in range(warmup):
+        for text in inputs:
+            fn(text)
+    samples: list[float] = []
+    for _ in range(rounds):
+        for text in inputs:
+            t0 = time.perf_counter_ns()
+            fn(text)
+            samples.append((time.perf_counter_ns() - t0) / 1000.0)
+    samples.sort()
+    return {
+        "calls": len(samples),
+        "mean_us": round(sum(samples) / len(samples), 2) if samples else 0.0,
+        "p50_us": round(_percentile(samples, 0.50), 2),
+        "p90_us": round(_percentile(samples, 0.90), 2),
+        "p99_us": round(_percentile(samples, 0.99), 2),
+        "max_us": round(samples[-1], 2) if samples else 0.0,
+    }
+
+
+def build_cases(corpus: dict[str, list[str]], font_path: str | None, font_size: int) -> dict[str, tuple[Callable, list[str]]]:
+    """case 이름 -> (호출할 함수(text), 입력 목록)"""
+    from PIL import Image, ImageDraw
+
+    from app.generator.script_generator import clean_stage_directions
+    from app.render.fonts import get_font
+    from app.short.short_creator import (
+        make_bottom_subtitle_image,
+        split_long_segment,
+        split_short_segments,
+        wrap_text_by_width,
+    )
+    from app.video.video_creator import split_text
+
+    font = get_font(font_path, font_size)
+    draw = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+    # 숏츠 자막 박스 안쪽 폭과 비슷하게
+    max_width = 960
+
+    def wrap(text: str):
+        return wrap_text_by_width(draw, text, font, max_width)
+
+    def subtitle(text: str):
+        return make_bottom_subtitle_image(text, (1080, 1920), font_path, font_size)
+
+    # 자막 한 장에 들어가는 길이 (split_long_segment 결과 정도)
+    short_runs = [t[:45] for t in corpus["hangul_run"]]
+    short_mixed = [t[:60] for t in corpus["mixed"]]
+
+    return {
+        "wrap_text_by_width/hangul_run": (wrap, corpus["hangul_run"]),
+        "wrap_text_by_width/mixed": (wrap, corpus["mixed"]),
+        "make_bottom_subtitle_image/hangul_run": (subtitle, short_runs),
+        "make_bottom_subtitle_image/mixed": (subtitle, short_mixed),
+        "split_short_segments/hook_list": (split_short_segments, corpus["hook_list"]),
+        "split_long_segment/hangul_run": (split_long_segment, corpus["hangul_run"]),
+        "split_long_segment/mixed": (split_long_segment, corpus["mixed"]),
+        "split_text/hangul_run": (split_text, corpus["hangul_run"]),
+        "split_text/mixed": (split_text, corpus["mixed"]),
+        "split_text/stage_directions": (split_text, corpus["stage_directions"]),
+        "clean_stage_directions/stage_directions": (clean_stage_directions, corpus["stage_directions"]),
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="text layout micro-benchmarks (synthetic corpus)")
+    parser.add_argument("--case", action="append", help="case 이름 부분 일치 필터 (반복 지정 가능)")
+    parser.add_argument("--corpus-size", type=int, default=20, help="카테고리별 입력 수")
+    parser.add_argument("--rounds", type=int, default=20, help="측정 라운드 수 (라운드마다 입력 전체를 한 번씩)")
+    parser.add_argument("--warmup", type=int, default=2, help="버리는 예열 라운드 수")
+    parser.add_argument("--font", default=None, help="폰트 경로 (기본: settings.FONT_PATH)")
+    parser.add_argument("--font-size", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="결과 JSON 경로 (기준선으로 저장할 때도 사용)")
+    parser.add_argument("--baseline", help="비교할 기준선 JSON (이전 --output 결과)")
+    parser.add_argument("--threshold", type=float, default=0.20, help="회귀 판정 비율 (0.20 = 20%%)")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    prepare_offline_env()
+    from app.bench.synthetic import make_text_corpus
+    from config import settings
+
+    font_path = args.font or str(getattr(settings, "FONT_PATH", "")) or None
+    corpus = make_text_corpus(args.corpus_size, args.seed)
+    cases = build_cases(corpus, font_path, args.font_size)
+    if args.case:
+        cases = {k: v for k, v in cases.items() if any(f in k for f in args.case)}
+
+    results: dict[str, dict] = {}
+    for name, (fn, inputs) in cases.items():
+        results[name] = measure(fn, inputs, rounds=max(1, args.rounds), warmup=max(0, args.warmup))
+        r = results[name]
+        print(f"{name:<44} p50={r['p50_us']:>10.1f}us p90={r['p90_us']:>10.1f}us p99={r['p99_us']:>10.1f}us", file=sys.stderr)
+
+    report = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "params": {
+            "corpus_size": args.corpus_size,
+            "rounds": args.rounds,
+            "warmup": args.warmup,
+            "font": font_path,
+            "font_exists": bool(font_path) and Path(font_path).exists(),
+            "font_size": args.font_size,
+            "seed": args.seed,
+        },
+        "environment": environment_info(),
+        "results": results,
+    }
+    if args.output:
+        write_json(Path(args.output), report)
+    else:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+
+    if not args.baseline:
+        return 0
+    rows = compare(results, load_json(args.baseline)["results"], DIRECTIONS, args.threshold)
+    print(format_comparison(rows))
+    regressions = [r for r in rows if r["regression"]]
+    if regressions:
+        print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,7 +5,7 @@ from typing import Sequence
 
 from config import settings
 
-from app.utils.artifacts import download_image_to
+from app.utils.artifacts import download_images
 from app.utils.run_context import RunContext
 
 from app.images.providers.pexels_provider import PexelsProvider
@@ -52,17 +52,20 @@ class ImageAggregator:
                 self.logger.info("provider_ok=%s urls=%s", provider_name, len(urls) if urls else 0)
 
                 if urls:
-                    for idx, url in enumerate(urls[:count]):
-                        if self.run_ctx:
-                            filename = f"{provider_name.lower()}_{idx+1:02d}.jpg"
-                            out_path = self.run_ctx.images_dir / filename
-                            ok = download_image_to(out_path, url)
+                    if self.run_ctx:
+                        # 파일명은 provider 결과 순서로 고정, 다운로드만 동시에 (실패한 번호는 비워 둔다)
+                        jobs = [
+                            (self.run_ctx.images_dir / f"{provider_name.lower()}_{idx+1:02d}.jpg", url)
+                            for idx, url in enumerate(urls[:count])
+                        ]
+                        results = download_images(jobs)
+                        for idx, ((out_path, url), ok) in enumerate(zip(jobs, results)):
                             if ok:
                                 saved_paths.append(str(out_path))
                             else:
                                 self.logger.warning("image_save_failed provider=%s idx=%s url=%s", provider_name, idx, url)
-                        else:
-                            saved_paths.append(url)
+                    else:
+                        saved_paths.extend(urls[:count])
 
                     if saved_paths:
                         return saved_paths[:count]
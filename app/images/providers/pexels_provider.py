@@ -4,6 +4,8 @@ import requests
 
 from app.utils.config_loader import config
 
+from app.images.search_cache import cached_search
+
 
 class PexelsProvider:
     """Pexels 무료 이미지 검색 제공자"""
@@ -12,6 +14,7 @@ class PexelsProvider:
         self.logger = logging.getLogger("auto_youtube.image.pexels")
         self.api_key = config.PEXELS_API_KEY
         self.base_url = "https://api.pexels.com/v1/search"
+        self.orientation = "landscape"
 
     def search_images(self, query, count=4):
         self.logger.info("search_images query=%r count=%s has_key=%s", query, count, bool(self.api_key))
@@ -21,18 +24,7 @@ class PexelsProvider:
             return self._get_fallback_images(count)
 
         try:
-            headers = {"Authorization": self.api_key}
-            params = {
-                "query": query,
-                "per_page": count,
-                "orientation": "landscape",
-            }
-
-            response = requests.get(self.base_url, headers=headers, params=params, timeout=10)
-            response.raise_for_status()
-
-            data = response.json()
-            images = [photo["src"]["large"] for photo in data.get("photos", [])]
+            images = cached_search("pexels", query, count, self.orientation, self._fetch)
 
             if images:
                 return images
@@ -43,6 +35,20 @@ class PexelsProvider:
             self.logger.exception("Pexels API 오류: %s", e)
             return self._get_fallback_images(count)
 
+    def _fetch(self, query, count):
+        headers = {"Authorization": self.api_key}
+        params = {
+            "query": query,
+            "per_page": count,
+            "orientation": self.orientation,
+        }
+
+        response = requests.get(self.base_url, headers=headers, params=params, timeout=10)
+        response.raise_for_status()
+
+        data = response.json()
+        return [photo["src"]["large"] for photo in data.get("photos", [])]
+
     def _get_fallback_images(self, count):
         fallback = [
             "https://images.pexels.com/photos/2280571/pexels-photo-2280571.jpeg",
@@ -4,6 +4,8 @@ import requests
 
 from app.utils.config_loader import config
 
+from app.images.search_cache import cached_search
+
 
 class PixabayProvider:
     def __init__(self):
@@ -12,18 +14,20 @@ class PixabayProvider:
         self.url = "https://pixabay.com/api/"
 
     def search_images(self, query: str, count: int = 4) -> list[str]:
-        params = {"q": query, "key": self.key, "per_page": count}
-
         if not self.key:
             return []
 
         try:
-            r = requests.get(self.url, params=params, timeout=10)
-            data = r.json()
-            hits = data.get("hits", [])
-            return [hit["largeImageURL"] for hit in hits[:count]]
+            return cached_search("pixabay", query, count, None, self._fetch)
         except Exception as e:
             self.logger.exception("Pixabay API 오류: %s", e)
             return []
 
-
+    def _fetch(self, query: str, count: int) -> list[str]:
+        params = {"q": query, "key": self.key, "per_page": count}
+        r = requests.get(self.url, params=params, timeout=10)
+        # 오류/rate limit 응답이 빈 결과로 캐시되지 않도록 예외로 올린다
+        r.raise_for_status()
+        data = r.json()
+        hits = data.get("hits", [])
+        return [hit["largeImageURL"] for hit in hits[:count]]
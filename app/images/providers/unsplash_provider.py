@@ -4,6 +4,8 @@ import requests
 
 from app.utils.config_loader import config
 
+from app.images.search_cache import cached_search
+
 
 class UnsplashProvider:
     def __init__(self):
@@ -12,18 +14,20 @@ class UnsplashProvider:
         self.url = "https://api.unsplash.com/search/photos"
 
     def search_images(self, query: str, count: int = 4) -> list[str]:
-        params = {"query": query, "per_page": count, "client_id": self.key}
-
         if not self.key:
             return []
 
         try:
-            r = requests.get(self.url, params=params, timeout=10)
-            data = r.json()
-            results = data.get("results", [])
-            return [result["urls"]["regular"] for result in results[:count]]
+            return cached_search("unsplash", query, count, None, self._fetch)
         except Exception as e:
             self.logger.exception("Unsplash API 오류: %s", e)
             return []
 
-
+    def _fetch(self, query: str, count: int) -> list[str]:
+        params = {"query": query, "per_page": count, "client_id": self.key}
+        r = requests.get(self.url, params=params, timeout=10)
+        # 오류/rate limit(403) 응답이 빈 결과로 캐시되지 않도록 예외로 올린다
+        r.raise_for_status()
+        data = r.json()
+        results = data.get("results", [])
+        return [result["urls"]["regular"] for result in results[:count]]
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Callable
+
+from config import settings
+
+DEFAULT_TTL_SEC = 60 * 60 * 24  # 1일
+
+Fetch = Callable[[str, int], list[str]]
+
+
+def normalize_query(query: str) -> str:
+    """뉴스 제목 그대로 오는 검색어를 키로 쓰기 위해 정규화 (NFKC + 대소문자 무시 + 공백 정리)"""
+    return " ".join(unicodedata.normalize("NFKC", query or "").casefold().split())
+
+
+class ImageSearchCache:
+    """
+    이미지 provider 검색 결과(URL 목록) 캐시 (OUTPUT_DIR/image_search_cache.json).
+    - 키: (provider, 정규화한 검색어, count, orientation)
+    - TTL 안: 캐시 결과를 그대로 반환 (API 호출 없음)
+    - TTL 지남 ~ TTL + stale_sec: 캐시 결과를 바로 반환하고 백그라운드 스레드에서 다시 받아 갱신 (stale-while-revalidate)
+    - 그보다 오래됐거나 없으면: 동기 호출 후 저장 / 호출이 실패하면 오래된 결과라도 있으면 그걸 쓴다
+    - 실패(예외)는 저장하지 않는다 (rate limit 응답이 빈 결과로 굳지 않도록)
+    """
+
+    def __init__(self, path: Path, ttl_sec: dict[str, int], stale_sec: int):
+        self.logger = logging.getLogger("auto_youtube.image.search_cache")
+        self.path = Path(path)
+        self.ttl_sec = dict(ttl_sec)
+        self.stale_sec = max(0, int(stale_sec))
+        self.counters = {"fresh": 0, "stale": 0, "misses": 0, "refreshes": 0, "errors": 0}
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict] | None = None
+        self._refreshing: set[str] = set()
+
+    @staticmethod
+    def key(provider: str, query: str, count: int, orientation: str | None) -> str:
+        return json.dumps([provider, normalize_query(query), int(count), orientation or ""], ensure_ascii=False)
+
+    def ttl_for(self, provider: str) -> int:
+        return int(self.ttl_sec.get(provider, self.ttl_sec.get("default", DEFAULT_TTL_SEC)))
+
+    def _load(self) -> dict[str, dict]:
+        if not self.path.exists():
+            return {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except Exception:
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _save(self) -> None:
+        # 다른 프로세스가 그사이 저장한 항목과 합치고, stale 구간까지 지난 항목은 버린다
+        now = int(time.time())
+        merged = {**self._load(), **self._entries}
+        self._entries = {
+            k: v
+            for k, v in merged.items()
+            if (now - int(v.get("fetched_at", 0))) < self.ttl_for(str(v.get("provider", ""))) + self.stale_sec
+        }
+        # 임시 파일 + os.replace: 쓰는 도중 종료되거나 다른 프로세스가 읽어도 잘린 JSON이 보이지 않는다
+        # (잘린 파일은 _load에서 {}가 되어 다음 저장 때 캐시 전체가 날아간다)
+        tmp = self.path.with_name(f".{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(self._entries, ensure_ascii=False, indent=2), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError as e:
+            self.logger.warning("search_cache_write_fail path=%s err=%s", self.path, e)
+            tmp.unlink(missing_ok=True)
+
+    def _store(self, key: str, provider: str, urls: list[str]) -> None:
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._load()
+            self._entries[key] = {"provider": provider, "urls": list(urls), "fetched_at": int(time.time())}
+            self._save()
+
+    def _revalidate(self, key: str, provider: str, query: str, count: int, fetch: Fetch) -> None:
+        try:
+            urls = fetch(query, count)
+            self._store(key, provider, urls)
+            with self._lock:
+                self.counters["refreshes"] += 1
+            self.logger.debug("search_cache_refreshed provider=%s query=%r", provider, query)
+        except Exception as e:
+            with self._lock:
+                self.counters["errors"] += 1
+            self.logger.warning("search_cache_refresh_fail provider=%s query=%r err=%s", provider, query, e)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def search(self, provider: str, query: str, count: int, orientation: str | None, fetch: Fetch) -> list[str]:
+        """fetch(query, count)는 실패 시 예외를 던져야 한다 (빈 목록은 정상 결과로 저장)"""
+        key = self.key(provider, query, count, orientation)
+        ttl = self.ttl_for(provider)
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._load()
+            entry = self._entries.get(key)
+            age = int(time.time()) - int(entry.get("fetched_at", 0)) if entry else None
+
+            if entry is not None and age < ttl:
+                self.counters["fresh"] += 1
+                self.logger.info("search_cache_hit provider=%s query=%r age=%ss", provider, query, age)
+                return list(entry["urls"])
+
+            if entry is not None and age < ttl + self.stale_sec:
+                self.counters["stale"] += 1
+                start = key not in self._refreshing
+                if start:
+                    self._refreshing.add(key)
+                self.logger.info("search_cache_stale provider=%s query=%r age=%ss revalidate=%s", provider, query, age, start)
+                if start:
+                    threading.Thread(
+                        target=self._revalidate,
+                        args=(key, provider, query, count, fetch),
+                        name=f"search-revalidate-{provider}",
+                        daemon=True,
+                    ).start()
+                return list(entry["urls"])
+
+            self.counters["misses"] += 1
+
+        try:
+            urls = fetch(query, count)
+        except Exception:
+            with self._lock:
+                self.counters["errors"] += 1
+            if entry is not None:
+                self.logger.warning("search_cache_fetch_fail -> using expired result provider=%s query=%r", provider, query)
+                return list(entry["urls"])
+            raise
+        self._store(key, provider, urls)
+        return list(urls)
+
+
+_cache: ImageSearchCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_search_cache() -> ImageSearchCache | None:
+    """settings 기반 프로세스 전역 검색 캐시 (IMAGE_SEARCH_CACHE_ENABLED=False면 None)"""
+    global _cache
+    if not bool(getattr(settings, "IMAGE_SEARCH_CACHE_ENABLED", True)):
+        return None
+    with _cache_lock:
+        if _cache is None:
+            path = Path(getattr(settings, "OUTPUT_DIR", ".")) / "image_search_cache.json"
+            ttl = dict(getattr(settings, "IMAGE_SEARCH_CACHE_TTL_SEC", {"default": DEFAULT_TTL_SEC}))
+            stale = int(getattr(settings, "IMAGE_SEARCH_CACHE_STALE_SEC", 60 * 60 * 24 * 7))
+            _cache = ImageSearchCache(path, ttl, stale)
+        return _cache
+
+
+def cached_search(provider: str, query: str, count: int, orientation: str | None, fetch: Fetch) -> list[str]:
+    """provider의 search_images 앞단: 캐시가 꺼져 있으면 fetch를 그대로 호출"""
+    cache = get_search_cache()
+    if cache is None:
+        return fetch(query, count)
+    return cache.search(provider, query, count, orientation, fetch)
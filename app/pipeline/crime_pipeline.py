@@ -49,14 +49,17 @@ class CrimePipeline(BasePipeline):
         images = self.images.search_images(news["title"], count=settings.LONG_IMAGE_COUNT)
         logger.info("images_found=%s first=%s", len(images) if images else 0, images[0] if images else None)
 
+        # 렌더 단계별 시간/카운트는 run 디렉터리의 render_metrics.json에 남긴다
+        run_dir = self.run_ctx.run_dir if self.run_ctx else None
+
         print("🎬 롱폼 영상 제작 중…")
         long_out = str(self.run_ctx.run_dir / settings.LONG_VIDEO_FILENAME) if self.run_ctx else None
-        long_video = create_long_video(long_script_display, images, output_path=long_out)
+        long_video = create_long_video(long_script_display, images, output_path=long_out, run_dir=run_dir)
 
         print("🎞 숏츠 제작 중…")
         short_out = str(self.run_ctx.run_dir / settings.SHORT_VIDEO_FILENAME) if self.run_ctx else None
         short_images = images[: settings.SHORT_IMAGE_COUNT] if images else ["https://via.placeholder.com/1080x1920/111111/ffffff?text=No+Images"]
-        short_video = create_short_video(short_script_display, short_images, output=short_out)
+        short_video = create_short_video(short_script_display, short_images, output=short_out, run_dir=run_dir)
 
         print("🎉 파이프라인 완료!")
         print(f"롱폼 영상: {long_video}")
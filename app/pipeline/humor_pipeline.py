@@ -71,7 +71,12 @@ class HumorPipeline(BasePipeline):
         short_images = images[: settings.SHORT_IMAGE_COUNT] if images else []
         if not short_images:
             short_images = ["https://via.placeholder.com/1080x1920/111111/ffffff?text=No+Images"]
-        short_video = create_short_video(short_script_display, short_images, output=short_out)
+        short_video = create_short_video(
+            short_script_display,
+            short_images,
+            output=short_out,
+            run_dir=self.run_ctx.run_dir if self.run_ctx else None,
+        )
 
         print("🎉 유머 파이프라인 완료!")
         # print(f"롱폼 영상: {long_video}")
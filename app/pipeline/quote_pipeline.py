@@ -67,6 +67,7 @@ class QuotePipeline(BasePipeline):
             output_path=str(out_path),
             token_interval_sec=token_interval,
             hold_sec=hold_sec,
+            run_dir=self.run_ctx.run_dir if self.run_ctx else None,
         )
 
         print("🎉 명언 숏츠 생성 완료!")
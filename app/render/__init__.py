@@ -0,0 +1,2 @@
+"""렌더링 엔진 모듈 (moviepy 클립 트리 없이 프레임을 직접 인코딩)"""
+
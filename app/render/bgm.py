@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+
+from app.render.ffmpeg import AudioTrack, _run, ffmpeg_binary
+from config import settings
+
+
+def _cache_dir() -> Path:
+    return Path(getattr(settings, "BGM_CACHE_DIR", Path(settings.OUTPUT_DIR) / "bgm_cache"))
+
+
+def _source_key(path: Path, volume: float, sample_rate: int, lufs: float | None) -> str:
+    # 원본 파일이 바뀌면(크기/수정 시각) 다른 키가 된다
+    st = path.stat()
+    raw = f"{path.resolve()}|{st.st_size}|{st.st_mtime_ns}|{volume}|{sample_rate}|{lufs}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:24]
+
+
+def _atomic_ffmpeg(cmd_head: list[str], out: Path, what: str) -> None:
+    tmp = out.with_name(f".{out.stem}.{os.getpid()}.tmp{out.suffix}")
+    try:
+        _run([*cmd_head, str(tmp)], what)
+        os.replace(tmp, out)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def prepare_bgm(path: str | Path, duration: float, *, volume: float = 1.0) -> AudioTrack | None:
+    """
+    BGM을 영상 길이에 맞춘 '바로 mux 가능한' 트랙으로 준비한다 (결과는 BGM_CACHE_DIR에 캐시).
+    1) base: 원본을 한 번만 디코드 → (BGM_NORMALIZE면 loudnorm으로 BGM_LOUDNESS_LUFS 맞춤) → volume 적용
+       → BGM_SAMPLE_RATE 스테레오 PCM WAV. BGM 파일/볼륨/정규화 설정이 같으면 재사용
+    2) fit: base를 duration에 맞게 반복(-stream_loop) 또는 자른 뒤 mp3로 한 번 인코딩.
+       같은 길이의 다음 렌더부터는 디코드/게인/인코딩 없이 copy로 mux 된다
+    반환: AudioTrack(copy=True) / 파일이 없으면 None
+    """
+    logger = logging.getLogger("auto_youtube.render.bgm")
+    src = Path(path)
+    if not src.exists():
+        logger.warning("bgm_missing path=%s", src)
+        return None
+
+    sample_rate = int(getattr(settings, "BGM_SAMPLE_RATE", 44100))
+    lufs = float(getattr(settings, "BGM_LOUDNESS_LUFS", -14.0)) if getattr(settings, "BGM_NORMALIZE", True) else None
+    key = _source_key(src, float(volume), sample_rate, lufs)
+    cache_dir = _cache_dir()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    base = cache_dir / f"{key}.wav"
+    if base.exists():
+        logger.info("bgm_cache hit stage=base path=%s", base)
+    else:
+        filters = []
+        if lufs is not None:
+            filters.append(f"loudnorm=I={lufs}:TP=-1.5:LRA=11")
+        filters.append(f"volume={volume}")
+        _atomic_ffmpeg(
+            [
+                ffmpeg_binary(), "-y", "-loglevel", "error",
+                "-i", str(src),
+                "-vn",
+                "-af", ",".join(filters),
+                "-ar", str(sample_rate),
+                "-ac", "2",
+                "-c:a", "pcm_s16le",
+            ],
+            base,
+            "bgm decode",
+        )
+        logger.info("bgm_cache miss stage=base src=%s -> %s", src, base)
+
+    # 길이는 ms 단위로 고정해서 같은 길이의 렌더끼리 공유
+    duration_ms = max(1, int(round(float(duration) * 1000)))
+    fitted = cache_dir / f"{key}_{duration_ms}ms.mp3"
+    if fitted.exists():
+        logger.info("bgm_cache hit stage=fit duration=%.3fs path=%s", duration_ms / 1000, fitted)
+    else:
+        # moviepy write_videofile 기본 오디오와 같게: mp3, 스테레오
+        _atomic_ffmpeg(
+            [
+                ffmpeg_binary(), "-y", "-loglevel", "error",
+                "-stream_loop", "-1",
+                "-i", str(base),
+                "-t", f"{duration_ms / 1000:.3f}",
+                "-c:a", "libmp3lame",
+                "-ar", str(sample_rate),
+                "-ac", "2",
+            ],
+            fitted,
+            "bgm fit",
+        )
+        logger.info("bgm_cache miss stage=fit duration=%.3fs path=%s", duration_ms / 1000, fitted)
+
+    return AudioTrack(str(fitted), copy=True)
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Iterator
+
+import numpy as np
+
+from app.render.kenburns import KenBurnsRenderer, plan_windows
+from app.render.timeline import Interval, Overlay, Timeline
+from app.render.transitions import TransitionBlender
+
+
+def blend_overlay(base: np.ndarray, overlay: Overlay, *, inplace: bool = False) -> np.ndarray:
+    """
+    RGB 프레임의 overlay.pos 위치에 RGBA 오버레이를 알파 합성한다.
+    moviepy blit과 같은 식(a*fg + (1-a)*bg 를 float로 계산 후 uint8 절삭)이라
+    기존 CompositeVideoClip 출력과 픽셀 단위로 같다. 알파가 있는 행만 계산한다.
+    inplace=True면 base 버퍼에 바로 쓴다 (움직이는 슬라이드의 프레임 버퍼용).
+    """
+    x, y = overlay.pos
+    r0, r1 = overlay.rows
+    bh, bw = base.shape[:2]
+    # 캔버스 밖으로 나가는 부분은 잘라낸다
+    y0, y1 = max(0, y + r0), min(bh, y + r1)
+    x0, x1 = max(0, x), min(bw, x + overlay.image.shape[1])
+    if y1 <= y0 or x1 <= x0:
+        return base
+
+    out = base if inplace else base.copy()
+    src = overlay.image[y0 - y : y1 - y, x0 - x : x1 - x]
+    fg = src[:, :, :3]
+    a = src[:, :, 3:4] / 255.0
+    out[y0:y1, x0:x1] = (a * fg + (1.0 - a) * base[y0:y1, x0:x1]).astype(np.uint8)
+    return out
+
+
+def compose(timeline: Timeline, slide: int, overlays: tuple[int, ...]) -> np.ndarray:
+    """정지 슬라이드 + 오버레이 합성 (motion 슬라이드/전환 구간은 iter_interval_frames 사용)"""
+    frame = timeline.slides[slide].image
+    for i in overlays:
+        frame = blend_overlay(frame, timeline.overlays[i].load())
+    return frame
+
+
+class CompositeCache:
+    """
+    (슬라이드 이미지, 활성 오버레이) 조합별 합성 결과를 담는 bounded LRU.
+    - 롱폼은 같은 URL 이미지를 순환 재사용하므로 슬라이드 index가 아니라 이미지 객체 기준으로 키를 잡는다
+    - 정지 구간 안의 프레임은 전부 hit가 되므로 miss 수 = 실제 합성 횟수
+    """
+
+    def __init__(self, timeline: Timeline, max_frames: int = 8):
+        self.timeline = timeline
+        self.max_frames = max(1, int(max_frames))
+        self.hits = 0
+        self.misses = 0
+        self._frames: OrderedDict[tuple, np.ndarray] = OrderedDict()
+
+    def get(self, slide: int, overlays: tuple[int, ...]) -> np.ndarray:
+        key = (id(self.timeline.slides[slide].image), overlays)
+        frame = self._frames.get(key)
+        if frame is not None:
+            self.hits += 1
+            self._frames.move_to_end(key)
+            return frame
+
+        self.misses += 1
+        frame = compose(self.timeline, slide, overlays)
+        frame.flags.writeable = False
+        self._frames[key] = frame
+        if len(self._frames) > self.max_frames:
+            self._frames.popitem(last=False)
+        return frame
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._frames)}
+
+
+class DynamicBuffers:
+    """
+    프레임을 한 장씩 평가하는 경로(moviepy compose_frame)에서 KenBurnsRenderer / TransitionBlender를 재사용한다.
+    - 렌더러는 슬라이드 index별로 만들고 최근 max_renderers개만 둔다 (전환 구간은 이전 + 현재 2개)
+    - 블렌더는 타임라인 전체에서 종류/크기가 같으므로 하나만 둔다
+    """
+
+    def __init__(self, timeline: Timeline, max_renderers: int = 2):
+        self.timeline = timeline
+        self.max_renderers = max(2, int(max_renderers))
+        self._renderers: OrderedDict[int, KenBurnsRenderer] = OrderedDict()
+        self._blender: TransitionBlender | None = None
+
+    def renderer(self, slide: int) -> KenBurnsRenderer:
+        renderer = self._renderers.get(slide)
+        if renderer is not None:
+            self._renderers.move_to_end(slide)
+            return renderer
+        renderer = KenBurnsRenderer(self.timeline.slides[slide].image, self.timeline.size)
+        self._renderers[slide] = renderer
+        if len(self._renderers) > self.max_renderers:
+            self._renderers.popitem(last=False)
+        return renderer
+
+    def blender(self) -> TransitionBlender:
+        if self._blender is None:
+            self._blender = TransitionBlender(self.timeline.transition.kind, self.timeline.size)
+        return self._blender
+
+
+def _background_frames(
+    timeline: Timeline, slide: int, slide_times: np.ndarray, buffers: DynamicBuffers | None = None
+) -> Iterator[np.ndarray]:
+    """
+    슬라이드 배경만 (오버레이 없음).
+    - 정지 슬라이드: 원본 배열 그대로 (읽기 전용일 수 있음)
+    - motion 슬라이드: crop 창은 한 번에 계산하고, 리샘플은 같은 버퍼에 한다
+    """
+    s = timeline.slides[slide]
+    if s.motion is None:
+        for _ in range(len(slide_times)):
+            yield s.image
+        return
+    src_h, src_w = s.image.shape[:2]
+    windows = plan_windows(s.motion, (src_w, src_h), slide_times / float(s.duration))
+    renderer = buffers.renderer(slide) if buffers is not None else KenBurnsRenderer(s.image, timeline.size)
+    for window in windows:
+        yield renderer.render(window)
+
+
+def _dynamic_frames(
+    timeline: Timeline,
+    slide: int,
+    overlays: tuple[int, ...],
+    slide_times: np.ndarray,
+    prev_slide: int | None = None,
+    buffers: DynamicBuffers | None = None,
+) -> Iterator[np.ndarray]:
+    """
+    프레임마다 배경이 바뀌는 구간 (motion 슬라이드 / 전환 구간).
+    - 전환 구간이면 이전 슬라이드(시각은 이전 슬라이드 끝 이후로 이어짐)와 정수 블렌드
+    - 오버레이는 섞인 배경 위에 한 번만 합성한다 (자막은 전환 중에도 흐려지지 않음)
+    yield한 배열은 다음 프레임에서 덮어쓰므로 바로 소비해야 한다 (ffmpeg 파이프는 바로 bytes로 쓴다).
+    buffers를 주면 렌더러/블렌더를 호출 간에 재사용한다 (프레임 단위 호출용).
+    """
+    frames = _background_frames(timeline, slide, slide_times, buffers)
+    if prev_slide is not None:
+        length = timeline.transition_length(prev_slide, slide)
+        prev_times = slide_times + float(timeline.slides[prev_slide].duration)
+        if buffers is not None:
+            blender = buffers.blender()
+        else:
+            blender = TransitionBlender(timeline.transition.kind, timeline.size)
+        frames = (
+            blender.blend(a, b, t / length)
+            for a, b, t in zip(_background_frames(timeline, prev_slide, prev_times, buffers), frames, slide_times)
+        )
+    loaded = [timeline.overlays[i].load() for i in overlays]
+    for frame in frames:
+        for o in loaded:
+            blend_overlay(frame, o, inplace=True)
+        yield frame
+
+
+def compose_frame(
+    timeline: Timeline,
+    t: float,
+    cache: CompositeCache | None = None,
+    buffers: DynamicBuffers | None = None,
+) -> np.ndarray:
+    slide, overlays = timeline.key_at(t)
+    prev_slide = timeline.prev_slide_at(t)
+    if prev_slide is not None or timeline.slides[slide].motion is not None:
+        slide_t = np.array([t - timeline.slide_start(slide)])
+        # 버퍼는 다음 프레임에서 덮어쓰므로 사본을 돌려준다
+        return next(_dynamic_frames(timeline, slide, overlays, slide_t, prev_slide, buffers)).copy()
+    if cache is not None:
+        return cache.get(slide, overlays)
+    return compose(timeline, slide, overlays)
+
+
+def compose_interval(timeline: Timeline, interval: Interval, cache: CompositeCache | None = None) -> np.ndarray:
+    if cache is not None:
+        return cache.get(interval.slide, interval.overlays)
+    return compose(timeline, interval.slide, interval.overlays)
+
+
+def iter_frames(
+    timeline: Timeline,
+    fps: float,
+    cache: CompositeCache | None = None,
+    intervals: list[Interval] | None = None,
+) -> Iterator[np.ndarray]:
+    """구간 단위로 타임라인 프레임을 순서대로 만든다 (프레임 i = t=i/fps)."""
+    if intervals is None:
+        intervals = timeline.intervals(fps)
+    for interval in intervals:
+        yield from iter_interval_frames(timeline, interval, fps, cache)
+
+
+def iter_interval_frames(
+    timeline: Timeline,
+    interval: Interval,
+    fps: float,
+    cache: CompositeCache | None = None,
+) -> Iterator[np.ndarray]:
+    """
+    구간 하나의 프레임들.
+    - 정지 슬라이드: 합성 1번(캐시) 후 같은 프레임 반복
+    - motion 슬라이드: 프레임마다 crop 창 리샘플 + 오버레이 합성 (버퍼 재사용)
+    - 전환 구간: 두 슬라이드 배경을 정수 블렌드 후 오버레이 합성 (이 구간에서만 프레임별 계산)
+    """
+    if timeline.is_static(interval):
+        frame = compose_interval(timeline, interval, cache)
+        for _ in range(interval.frames):
+            yield frame
+        return
+    slide_times = interval.slide_time + np.arange(interval.frames, dtype=np.float64) / fps
+    yield from _dynamic_frames(timeline, interval.slide, interval.overlays, slide_times, interval.prev_slide)
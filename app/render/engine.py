@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import logging
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+
+from app.render.compositor import CompositeCache, compose_interval, iter_frames, iter_interval_frames
+from app.render.ffmpeg import AudioTrack, concat_videos, encode_still, write_frames
+from app.render.metrics import RenderMetrics
+from app.render.overlay_cache import merge_overlay_cache_stats, overlay_cache_stats, stats_delta
+from app.render.profile import EncodeProfile, get_profile
+from app.render.timeline import Interval, Timeline, split_intervals
+from config import settings
+
+ENGINES = ("pipe", "segments")
+
+
+@dataclass(frozen=True)
+class ChunkJob:
+    """워커 프로세스 하나가 인코딩할 타임라인 조각 (오디오 없이)"""
+
+    timeline: Timeline
+    intervals: list[Interval]
+    output_path: str
+    fps: float
+    engine: str
+    profile: EncodeProfile
+
+
+def _timed_frames(frames: Iterator[np.ndarray], clock: dict[str, float]) -> Iterator[np.ndarray]:
+    """프레임을 만드는(합성) 시간만 clock["compose_s"]에 누적한다 (ffmpeg 쓰기 시간은 제외)"""
+    it = iter(frames)
+    while True:
+        t0 = time.perf_counter()
+        try:
+            frame = next(it)
+        except StopIteration:
+            clock["compose_s"] += time.perf_counter() - t0
+            return
+        clock["compose_s"] += time.perf_counter() - t0
+        yield frame
+
+
+def _render_pipe(
+    timeline: Timeline,
+    intervals: list[Interval],
+    output_path: str,
+    fps: float,
+    audio: AudioTrack | None,
+    cache: CompositeCache,
+    profile: EncodeProfile,
+    clock: dict[str, float],
+) -> int:
+    return write_frames(
+        _timed_frames(iter_frames(timeline, fps, cache, intervals), clock),
+        output_path,
+        timeline.size,
+        fps,
+        audio=audio,
+        duration=timeline.duration,
+        profile=profile,
+    )
+
+
+def _render_segments(
+    timeline: Timeline,
+    intervals: list[Interval],
+    output_path: str,
+    fps: float,
+    audio: AudioTrack | None,
+    cache: CompositeCache,
+    profile: EncodeProfile,
+    clock: dict[str, float],
+) -> int:
+    """
+    정지 구간마다 합성 1번 + 짧은 still 세그먼트 인코딩 1번,
+    마지막에 concat demuxer로 재인코딩 없이 이어 붙인다.
+    motion 슬라이드/전환 구간은 같은 인코더 설정으로 프레임을 파이프 인코딩한 세그먼트가 된다.
+    """
+    out = Path(output_path)
+    with tempfile.TemporaryDirectory(prefix=f".{out.stem}_segments_", dir=out.parent) as tmp:
+        paths: list[str] = []
+        for i, interval in enumerate(intervals):
+            seg_path = str(Path(tmp) / f"seg_{i:05d}.mp4")
+            if not timeline.is_static(interval):
+                write_frames(
+                    _timed_frames(iter_interval_frames(timeline, interval, fps, cache), clock),
+                    seg_path,
+                    timeline.size,
+                    fps,
+                    profile=profile,
+                )
+            else:
+                t0 = time.perf_counter()
+                frame = compose_interval(timeline, interval, cache)
+                clock["compose_s"] += time.perf_counter() - t0
+                encode_still(frame, seg_path, fps, interval.frames, profile=profile)
+            paths.append(seg_path)
+        concat_videos(paths, output_path, audio=audio, duration=timeline.duration)
+    return sum(i.frames for i in intervals)
+
+
+def _encode(
+    timeline: Timeline,
+    intervals: list[Interval],
+    output_path: str,
+    fps: float,
+    engine: str,
+    audio: AudioTrack | None,
+    cache: CompositeCache,
+    profile: EncodeProfile,
+    clock: dict[str, float],
+) -> int:
+    if engine == "segments":
+        return _render_segments(timeline, intervals, output_path, fps, audio, cache, profile, clock)
+    return _render_pipe(timeline, intervals, output_path, fps, audio, cache, profile, clock)
+
+
+def _encode_chunk(job: ChunkJob) -> tuple[int, dict[str, int], dict[str, int], float]:
+    overlay_before = overlay_cache_stats()
+    cache = CompositeCache(job.timeline, int(getattr(settings, "RENDER_COMPOSITE_CACHE_SIZE", 8)))
+    clock = {"compose_s": 0.0}
+    frames = _encode(job.timeline, job.intervals, job.output_path, job.fps, job.engine, None, cache, job.profile, clock)
+    # 워커에서 렌더된 자막의 디스크 캐시 hit/miss와 합성 시간은 부모 프로세스로 돌려보낸다
+    return frames, cache.stats(), stats_delta(overlay_cache_stats(), overlay_before), clock["compose_s"]
+
+
+def _render_parallel(
+    timeline: Timeline,
+    intervals: list[Interval],
+    output_path: str,
+    fps: float,
+    engine: str,
+    audio: AudioTrack | None,
+    workers: int,
+    profile: EncodeProfile,
+) -> tuple[int, dict[str, int], float]:
+    """
+    슬라이드 경계로 자른 조각을 워커 프로세스마다 따로 인코딩하고,
+    concat demuxer로 무손실 연결하면서 BGM은 마지막에 한 번만 mux 한다.
+    """
+    logger = logging.getLogger("auto_youtube.render")
+    chunks = split_intervals(intervals, workers)
+    logger.info("parallel workers=%s chunks=%s", workers, [sum(iv.frames for iv in c) for c in chunks])
+
+    out = Path(output_path)
+    with tempfile.TemporaryDirectory(prefix=f".{out.stem}_chunks_", dir=out.parent) as tmp:
+        jobs: list[ChunkJob] = []
+        for i, chunk in enumerate(chunks):
+            sub, sub_intervals = timeline.subset(chunk, fps)
+            chunk_path = str(Path(tmp) / f"chunk_{i:03d}.mp4")
+            jobs.append(ChunkJob(sub, sub_intervals, chunk_path, fps, engine, profile))
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            results = list(pool.map(_encode_chunk, jobs))
+
+        concat_videos([j.output_path for j in jobs], output_path, audio=audio, duration=timeline.duration)
+
+    stats = {"hits": 0, "misses": 0}
+    for _, s, overlay_delta, _ in results:
+        stats["hits"] += s["hits"]
+        stats["misses"] += s["misses"]
+        merge_overlay_cache_stats(overlay_delta)
+    return sum(r[0] for r in results), stats, sum(r[3] for r in results)
+
+
+def render_timeline(
+    timeline: Timeline,
+    output_path: str,
+    *,
+    fps: float,
+    audio: AudioTrack | None = None,
+    engine: str = "pipe",
+    workers: int | None = None,
+    profile: EncodeProfile | None = None,
+    metrics: RenderMetrics | None = None,
+) -> str:
+    """
+    Timeline을 engine으로 인코딩해서 output_path에 저장한다.
+    - "pipe": 프레임 제너레이터 -> ffmpeg stdin (raw rgb24)
+    - "segments": 정지 구간별 still 세그먼트 인코딩 -> concat demuxer
+    - workers > 1: 타임라인을 슬라이드 경계로 나눠 프로세스 풀에서 병렬 인코딩
+    - metrics: 구간/합성/인코딩 프레임 수와 합성(compose)/인코딩(encode) 시간을 기록
+      (병렬이면 compose는 워커 합계라 encode는 따로 나누지 않는다)
+    """
+    logger = logging.getLogger("auto_youtube.render")
+    if engine not in ENGINES:
+        raise ValueError(f"unknown render engine: {engine!r} (choices={ENGINES})")
+    if workers is None:
+        workers = int(getattr(settings, "RENDER_WORKERS", 1))
+    if profile is None:
+        profile = get_profile()
+
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    intervals = timeline.intervals(fps)
+    logger.info(
+        "render start engine=%s profile=%s size=%s fps=%s intervals=%s frames=%s",
+        engine,
+        profile.name,
+        timeline.size,
+        fps,
+        len(intervals),
+        timeline.frame_count(fps),
+    )
+
+    t0 = time.perf_counter()
+    parallel = workers > 1 and len(intervals) > 1
+    if parallel:
+        frames, stats, compose_s = _render_parallel(timeline, intervals, output_path, fps, engine, audio, workers, profile)
+    else:
+        cache = CompositeCache(timeline, int(getattr(settings, "RENDER_COMPOSITE_CACHE_SIZE", 8)))
+        clock = {"compose_s": 0.0}
+        frames = _encode(timeline, intervals, output_path, fps, engine, audio, cache, profile, clock)
+        stats = cache.stats()
+        compose_s = clock["compose_s"]
+    elapsed = time.perf_counter() - t0
+    logger.info(
+        "render done engine=%s out=%s frames=%s elapsed=%.2fs (%.1f fps)",
+        engine,
+        output_path,
+        frames,
+        elapsed,
+        frames / elapsed if elapsed > 0 else 0.0,
+    )
+    logger.info(
+        "composite_cache hits=%s misses=%s intervals=%s",
+        stats["hits"],
+        stats["misses"],
+        len(intervals),
+    )
+    if metrics is not None:
+        # 정지 구간은 합성 1번(캐시 miss), motion/전환 구간은 프레임마다 합성
+        dynamic = sum(iv.frames for iv in intervals if not timeline.is_static(iv))
+        metrics.add("intervals", len(intervals))
+        metrics.add("frames_composited", stats["misses"] + dynamic)
+        metrics.add("frames_encoded", frames)
+        metrics.add("render_workers", workers if parallel else 1)
+        metrics.add_time("compose", compose_s)
+        if not parallel:
+            metrics.add_time("encode", max(0.0, elapsed - compose_s))
+    return output_path
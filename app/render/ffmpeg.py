@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import logging
+import subprocess
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Sequence
+
+import numpy as np
+
+from app.render.profile import EncodeProfile, get_profile
+
+
+@dataclass(frozen=True)
+class AudioTrack:
+    """
+    영상에 mux 할 오디오.
+    - copy=True: 이미 길이/게인/코덱이 맞춰진 트랙(prepare_bgm 결과) → 재인코딩 없이 그대로 mux
+    """
+
+    path: str
+    volume: float = 1.0
+    copy: bool = False
+
+
+def ffmpeg_binary() -> str:
+    """moviepy와 같은 ffmpeg 바이너리 (FFMPEG_BINARY 환경변수 / imageio-ffmpeg)"""
+    from moviepy.config import get_setting
+
+    return get_setting("FFMPEG_BINARY")
+
+
+def _audio_args(audio: AudioTrack, index: int) -> list[str]:
+    if audio.copy:
+        return ["-map", f"{index}:a:0", "-acodec", "copy"]
+    # moviepy write_videofile 기본값과 같게: mp3, 44.1kHz 스테레오
+    return [
+        "-map", f"{index}:a:0",
+        "-af", f"volume={audio.volume}",
+        "-acodec", "libmp3lame",
+        "-ar", "44100",
+        "-ac", "2",
+    ]
+
+
+def _run(cmd: list[str], what: str) -> None:
+    proc = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    if proc.returncode != 0:
+        err = proc.stderr.decode("utf-8", "replace").strip()
+        raise RuntimeError(f"ffmpeg {what} failed code={proc.returncode} err={err}")
+
+
+class FfmpegPipeWriter:
+    """
+    raw RGB 프레임을 ffmpeg stdin 파이프로 바로 밀어 넣는 인코더.
+    - moviepy write_videofile과 같은 코덱/픽셀포맷(libx264, yuv420p)
+    - preset/crf/tune/threads는 EncodeProfile에서
+    - audio가 있으면 같은 ffmpeg 프로세스에서 mux (별도 임시 오디오 파일 없음)
+    """
+
+    def __init__(
+        self,
+        output_path: str,
+        size: tuple[int, int],
+        fps: float,
+        *,
+        audio: AudioTrack | None = None,
+        duration: float | None = None,
+        profile: EncodeProfile | None = None,
+        extra_args: Sequence[str] = (),
+    ):
+        self.logger = logging.getLogger("auto_youtube.render.ffmpeg")
+        self.output_path = output_path
+        self.size = size
+        w, h = size
+
+        cmd = [
+            ffmpeg_binary(),
+            "-y",
+            "-loglevel", "error",
+            "-f", "rawvideo",
+            "-vcodec", "rawvideo",
+            "-s", f"{w}x{h}",
+            "-pix_fmt", "rgb24",
+            "-r", f"{fps:.02f}",
+            "-i", "-",
+        ]
+        if audio is not None:
+            cmd.extend(["-i", audio.path, "-map", "0:v:0", *_audio_args(audio, 1)])
+        else:
+            cmd.append("-an")
+        cmd.extend((profile or get_profile()).video_args())
+        if w % 2 == 0 and h % 2 == 0:
+            cmd.extend(["-pix_fmt", "yuv420p"])
+        cmd.extend(extra_args)
+        if duration is not None:
+            cmd.extend(["-t", f"{duration:.3f}"])
+        cmd.append(output_path)
+
+        self.logger.debug("ffmpeg cmd=%s", " ".join(cmd))
+        self.proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        self.frames = 0
+
+    def write(self, frame: np.ndarray) -> None:
+        try:
+            self.proc.stdin.write(np.ascontiguousarray(frame, dtype=np.uint8).tobytes())
+        except (BrokenPipeError, OSError) as e:
+            err = self.proc.stderr.read().decode("utf-8", "replace") if self.proc.stderr else ""
+            raise RuntimeError(f"ffmpeg pipe failed output={self.output_path} err={err.strip()}") from e
+        self.frames += 1
+
+    def close(self) -> None:
+        if self.proc.stdin and not self.proc.stdin.closed:
+            self.proc.stdin.close()
+        err = self.proc.stderr.read().decode("utf-8", "replace") if self.proc.stderr else ""
+        code = self.proc.wait()
+        if code != 0:
+            raise RuntimeError(f"ffmpeg exited code={code} output={self.output_path} err={err.strip()}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.proc.kill()
+            self.proc.wait()
+        return False
+
+
+def write_frames(
+    frames: Iterable[np.ndarray],
+    output_path: str,
+    size: tuple[int, int],
+    fps: float,
+    *,
+    audio: AudioTrack | None = None,
+    duration: float | None = None,
+    profile: EncodeProfile | None = None,
+) -> int:
+    """프레임 iterable을 끝까지 인코딩하고 쓴 프레임 수를 반환한다."""
+    with FfmpegPipeWriter(output_path, size, fps, audio=audio, duration=duration, profile=profile) as writer:
+        for frame in frames:
+            writer.write(frame)
+    return writer.frames
+
+
+def encode_still(
+    frame: np.ndarray,
+    output_path: str,
+    fps: float,
+    frames: int,
+    *,
+    profile: EncodeProfile | None = None,
+) -> None:
+    """
+    정지 프레임 1장을 frames 길이의 영상 세그먼트로 인코딩한다.
+    - 프레임은 한 번만 파이프로 보내고 ffmpeg loop 필터로 반복
+    """
+    h, w = frame.shape[:2]
+    loop = ["-vf", f"loop=loop={max(0, frames - 1)}:size=1:start=0", "-frames:v", str(frames)]
+    with FfmpegPipeWriter(output_path, (w, h), fps, profile=profile, extra_args=loop) as writer:
+        writer.write(frame)
+
+
+def concat_videos(
+    paths: Sequence[str],
+    output_path: str,
+    *,
+    audio: AudioTrack | None = None,
+    duration: float | None = None,
+) -> None:
+    """
+    같은 코덱 파라미터로 인코딩된 세그먼트들을 concat demuxer로 재인코딩 없이 잇는다.
+    audio가 있으면 이 단계에서 한 번만 mux 한다.
+    """
+    out = Path(output_path)
+    list_path = out.with_name(f".{out.stem}_concat.txt")
+    lines = []
+    for p in paths:
+        escaped = str(Path(p).resolve()).replace("'", "'\\''")
+        lines.append(f"file '{escaped}'")
+    list_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    cmd = [
+        ffmpeg_binary(),
+        "-y",
+        "-loglevel", "error",
+        "-f", "concat",
+        "-safe", "0",
+        "-i", str(list_path),
+    ]
+    if audio is not None:
+        cmd.extend(["-i", audio.path, "-map", "0:v:0", *_audio_args(audio, 1)])
+    else:
+        cmd.append("-an")
+    cmd.extend(["-vcodec", "copy"])
+    if duration is not None:
+        cmd.extend(["-t", f"{duration:.3f}"])
+    cmd.append(str(out))
+
+    try:
+        _run(cmd, "concat")
+    finally:
+        list_path.unlink(missing_ok=True)
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+
+from PIL import ImageFont
+
+from config import settings
+
+_lock = threading.Lock()
+_faces: OrderedDict[tuple[str, int, int], ImageFont.FreeTypeFont] = OrderedDict()
+_missing: set[str] = set()
+_default: ImageFont.ImageFont | None = None
+
+
+def _default_font() -> ImageFont.ImageFont:
+    global _default
+    if _default is None:
+        _default = ImageFont.load_default()
+    return _default
+
+
+def get_font(path: str | None, size: int, index: int = 0) -> ImageFont.ImageFont:
+    """
+    프로세스 전역 폰트 레지스트리.
+    - (path, size, index) 별로 truetype 파싱은 한 번만 하고 bounded LRU(FONT_CACHE_SIZE)에 보관
+    - 로드에 실패한 path는 기록해 두고, 이후에는 다시 시도하지 않고 기본 폰트를 돌려준다
+    """
+    if not path:
+        return _default_font()
+
+    path = str(path)
+    key = (path, int(size), int(index))
+    with _lock:
+        font = _faces.get(key)
+        if font is not None:
+            _faces.move_to_end(key)
+            return font
+        if path in _missing:
+            return _default_font()
+
+    try:
+        font = ImageFont.truetype(path, int(size), index=int(index))
+    except Exception as e:
+        logging.getLogger("auto_youtube.render.fonts").warning(
+            "font_load_fail path=%s err=%s -> using default font", path, e
+        )
+        with _lock:
+            _missing.add(path)
+        return _default_font()
+
+    max_faces = max(1, int(getattr(settings, "FONT_CACHE_SIZE", 64)))
+    with _lock:
+        _faces[key] = font
+        while len(_faces) > max_faces:
+            _faces.popitem(last=False)
+    return font
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+from config import settings
+
+MOTION_MODES = ("kenburns", "none")
+
+
+@dataclass(frozen=True)
+class KenBurns:
+    """
+    슬라이드 한 장의 pan/zoom 움직임.
+    - zoom: 1.0 = 오버샘플 원본 전체, max_zoom = 출력 1픽셀 = 원본 1픽셀
+    - pan: 남는 여백 안에서 창의 위치 (0.0 = 왼쪽/위, 0.5 = 가운데, 1.0 = 오른쪽/아래)
+    - 진행률 0~1 동안 선형 보간
+    """
+
+    zoom_start: float = 1.0
+    zoom_end: float = 1.12
+    pan_start: tuple[float, float] = (0.5, 0.5)
+    pan_end: tuple[float, float] = (0.5, 0.5)
+
+    @property
+    def max_zoom(self) -> float:
+        return max(1.0, self.zoom_start, self.zoom_end)
+
+
+# 슬라이드마다 돌려 쓰는 움직임 패턴 (줌 인/아웃 + 팬 방향)
+_PATTERNS = (
+    (False, (0.5, 0.5), (0.5, 0.5)),
+    (True, (0.2, 0.5), (0.8, 0.5)),
+    (False, (0.5, 0.3), (0.5, 0.7)),
+    (True, (0.8, 0.4), (0.2, 0.6)),
+)
+
+
+def ken_burns_for(index: int, zoom: float) -> KenBurns:
+    """index번째 슬라이드의 움직임 (같은 index면 항상 같은 결과라 재실행/병렬 렌더에서도 동일)"""
+    zoom = max(1.0, float(zoom))
+    zoom_out, pan_start, pan_end = _PATTERNS[index % len(_PATTERNS)]
+    if zoom_out:
+        return KenBurns(zoom, 1.0, pan_start, pan_end)
+    return KenBurns(1.0, zoom, pan_start, pan_end)
+
+
+def configured_zoom() -> float | None:
+    """settings.SLIDE_MOTION이 "kenburns"면 KEN_BURNS_ZOOM, "none"이면 None"""
+    mode = str(getattr(settings, "SLIDE_MOTION", "none"))
+    if mode not in MOTION_MODES:
+        raise ValueError(f"unknown slide motion: {mode!r} (choices={MOTION_MODES})")
+    zoom = float(getattr(settings, "KEN_BURNS_ZOOM", 1.12))
+    if mode == "none" or zoom <= 1.0:
+        return None
+    return zoom
+
+
+def source_size(size: tuple[int, int], max_zoom: float) -> tuple[int, int]:
+    """max_zoom까지 확대해도 1:1 이상 해상도가 되도록 오버샘플한 원본 크기"""
+    w, h = size
+    return (math.ceil(w * max_zoom), math.ceil(h * max_zoom))
+
+
+def plan_windows(motion: KenBurns, src_size: tuple[int, int], progress: np.ndarray) -> np.ndarray:
+    """
+    진행률 배열(0~1)에 대한 원본 좌표 crop 창을 한 번에 계산한다.
+    반환: (n, 4) float64 = (x0, y0, width, height)
+    """
+    sw, sh = src_size
+    p = np.clip(np.asarray(progress, dtype=np.float64), 0.0, 1.0)
+    zoom = motion.zoom_start + (motion.zoom_end - motion.zoom_start) * p
+    ww = sw / zoom
+    wh = sh / zoom
+    px = motion.pan_start[0] + (motion.pan_end[0] - motion.pan_start[0]) * p
+    py = motion.pan_start[1] + (motion.pan_end[1] - motion.pan_start[1]) * p
+    x0 = px * (sw - ww)
+    y0 = py * (sh - wh)
+    return np.stack([x0, y0, ww, wh], axis=1)
+
+
+def _axis_taps(start: float, extent: float, n: int, limit: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """출력 n 픽셀 중심을 원본 [start, start+extent) 에 매핑한 bilinear 두 탭 index + 8bit 가중치"""
+    pos = start + (np.arange(n, dtype=np.float64) + 0.5) * (extent / n) - 0.5
+    pos = np.clip(pos, 0.0, limit - 1)
+    i0 = np.floor(pos).astype(np.intp)
+    i1 = np.minimum(i0 + 1, limit - 1)
+    w1 = np.rint((pos - i0) * 256.0).astype(np.uint16)
+    return i0, i1, w1
+
+
+class KenBurnsRenderer:
+    """
+    오버샘플 원본 한 장에서 crop 창을 출력 크기로 리샘플한다 (PIL 왕복 없음).
+    - 창은 축 정렬 확대/이동뿐이라 bilinear를 가로 → 세로 두 번의 1D 보간으로 나눈다
+    - 가로 탭은 픽셀(3바이트)을 void 한 칸으로 보고 gather 해서 채널 축 fancy indexing 비용을 피한다
+    - 가중치는 8bit 고정소수점: a*(256-w) + b*w <= 255*256 이라 uint16 안에서 끝난다
+    - 중간/출력 버퍼는 미리 잡아 두고 재사용하므로 render()가 돌려준 배열은 다음 호출 때 덮어쓴다
+    """
+
+    def __init__(self, source: np.ndarray, size: tuple[int, int]):
+        self.source = np.ascontiguousarray(source, dtype=np.uint8)
+        self.size = size
+        w, h = size
+        sh, sw = self.source.shape[:2]
+        # (H, W, 3) uint8 -> (H, W) 3바이트 void: 열 gather가 픽셀 단위 memcpy가 된다
+        self._pixels = self.source.reshape(sh, sw * 3).view("V3")
+        self._cols_a = np.empty((sh, w), dtype="V3")
+        self._cols_b = np.empty((sh, w), dtype="V3")
+        # 보간 버퍼는 (행, w*3) 2D로 잡아 가장 안쪽 루프가 길고 연속되게 한다
+        self._cols = np.empty((sh, w * 3), dtype=np.uint16)
+        self._cols_tmp = np.empty((sh, w * 3), dtype=np.uint16)
+        self._rows = np.empty((h, w * 3), dtype=np.uint16)
+        self._rows_tmp = np.empty((h, w * 3), dtype=np.uint16)
+        self.out = np.empty((h, w, 3), dtype=np.uint8)
+
+    def render(self, window: np.ndarray) -> np.ndarray:
+        x0, y0, ww, wh = (float(v) for v in window)
+        w, h = self.size
+        sh, sw = self.source.shape[:2]
+        yi0, yi1, wy = _axis_taps(y0, wh, h, sh)
+        xi0, xi1, wx = _axis_taps(x0, ww, w, sw)
+
+        # 창이 걸치는 행만 가로 보간한다
+        ya, yb = int(yi0[0]), int(yi1[-1]) + 1
+        n = yb - ya
+        pixels = self._pixels[ya:yb]
+        ca, cb = self._cols_a[:n], self._cols_b[:n]
+        np.take(pixels, xi0, axis=1, out=ca)
+        np.take(pixels, xi1, axis=1, out=cb)
+        cols, tmp = self._cols[:n], self._cols_tmp[:n]
+        wx3 = np.repeat(wx, 3)
+        np.multiply(ca.view(np.uint8).reshape(n, w * 3), 256 - wx3, out=cols)
+        np.multiply(cb.view(np.uint8).reshape(n, w * 3), wx3, out=tmp)
+        cols += tmp
+        cols += 128
+        cols >>= 8
+
+        # 세로 보간 (행 gather는 연속 메모리 복사)
+        wy = wy[:, None]
+        rows, tmp = self._rows, self._rows_tmp
+        np.take(cols, yi0 - ya, axis=0, out=rows)
+        np.take(cols, yi1 - ya, axis=0, out=tmp)
+        rows *= 256 - wy
+        tmp *= wy
+        rows += tmp
+        rows += 128
+        rows >>= 8
+        np.copyto(self.out.reshape(h, w * 3), rows, casting="unsafe")
+        return self.out
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator
+
+from app.utils.artifacts import save_json
+
+METRICS_FILENAME = "render_metrics.json"
+
+
+class RenderMetrics:
+    """
+    렌더 1회(롱폼/숏츠/명언 숏츠)의 단계별 wall time과 카운트.
+    - phase("load_images") 처럼 감싼 구간의 시간을 초 단위로 누적
+    - add("images_decoded", n) 카운트 누적
+    - write(run_dir)로 run_dir/render_metrics.json 의 kind 항목에 기록 (같은 run의 다른 렌더와 한 파일)
+    """
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        self.started_at = datetime.now().isoformat(timespec="seconds")
+        self.phases: dict[str, float] = {}
+        self.counts: dict[str, float] = {}
+        self._t0 = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - t0)
+
+    def add_time(self, name: str, seconds: float) -> None:
+        self.phases[name] = self.phases.get(name, 0.0) + float(seconds)
+
+    def add(self, name: str, n: float = 1) -> None:
+        self.counts[name] = self.counts.get(name, 0) + n
+
+    def record_images(self, requested: int, loaded: int, pool_delta: dict[str, int]) -> None:
+        """슬라이드 로드 결과 + SlidePool 카운터 변화량 (다운로드/디코드는 풀 캐시 miss만)"""
+        self.add("images_requested", requested)
+        self.add("images_loaded", loaded)
+        self.add("images_failed", requested - loaded)
+        self.add("images_downloaded", pool_delta.get("downloads", 0))
+        self.add("images_decoded", pool_delta.get("decodes", 0))
+
+    def record_overlays(self, count: int, cache_delta: dict[str, int]) -> None:
+        """자막 오버레이 수 + overlay_cache 카운터 변화량 (실제 래스터화 횟수/시간, 디스크 캐시 hit)"""
+        self.add("overlays", count)
+        self.add("overlays_rendered", cache_delta.get("renders", 0))
+        self.add("overlay_cache_hits", cache_delta.get("hits", 0))
+        self.add_time("overlay_render", cache_delta.get("render_ms", 0) / 1000.0)
+
+    def to_dict(self) -> dict:
+        render_s = self.phases.get("render", 0.0)
+        encoded = self.counts.get("frames_encoded", 0)
+        return {
+            "kind": self.kind,
+            "started_at": self.started_at,
+            "total_s": round(time.perf_counter() - self._t0, 4),
+            "phases_s": {k: round(v, 4) for k, v in self.phases.items()},
+            "counts": dict(self.counts),
+            "encode_fps": round(encoded / render_s, 2) if render_s > 0 else 0.0,
+        }
+
+    def finish(self, output_path: str | Path, run_dir: str | Path | None = None) -> dict:
+        """출력 파일 크기를 채우고 로그 + (run_dir가 있으면) render_metrics.json 기록"""
+        try:
+            self.counts["output_bytes"] = os.path.getsize(output_path)
+        except OSError:
+            self.counts["output_bytes"] = 0
+        data = self.to_dict()
+        logger = logging.getLogger("auto_youtube.render.metrics")
+        logger.info("render_metrics %s", json.dumps(data, ensure_ascii=False))
+        if run_dir is not None:
+            write_render_metrics(Path(run_dir), data)
+        return data
+
+
+def write_render_metrics(run_dir: Path, data: dict) -> Path:
+    """run_dir/render_metrics.json 에 data["kind"] 항목을 추가/교체한다 (롱폼 + 숏츠가 한 파일)"""
+    path = Path(run_dir) / METRICS_FILENAME
+    existing: dict = {}
+    if path.exists():
+        try:
+            existing = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            existing = {}
+    existing[data["kind"]] = data
+    save_json(path, existing)
+    return path
+
+
+def moviepy_frame_count(duration: float, fps: float) -> int:
+    # moviepy write_videofile이 합성/인코딩하는 프레임 수 (Timeline.frame_count와 같은 식)
+    return max(1, math.ceil(float(duration) * float(fps) - 1e-9))
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import numpy as np
+from moviepy.editor import ImageClip, VideoClip, concatenate_videoclips
+
+from app.render.compositor import DynamicBuffers, compose_frame
+from app.render.kenburns import KenBurnsRenderer, plan_windows
+from app.render.timeline import LazyOverlay, Overlay, Slide, Timeline
+from app.render.transitions import Transition
+
+
+def overlay_clip(overlay: Overlay | LazyOverlay, canvas_size: tuple[int, int]) -> VideoClip:
+    """
+    오버레이를 moviepy 클립으로 감싼다 (moviepy 렌더 경로용).
+    - 이미지/마스크/위치는 프레임이 요청될 때 overlay.load()에서 가져오므로
+      LazyOverlay는 타임라인이 도달했을 때 처음 렌더된다
+    - VideoClip(make_frame)은 생성 시 t=0 프레임으로 size를 재므로 make_frame을 나중에 붙인다
+    """
+    clip = VideoClip()
+    clip.make_frame = lambda t: overlay.load().image[:, :, :3]
+    clip.size = canvas_size
+
+    mask = VideoClip(ismask=True)
+    mask.make_frame = lambda t: overlay.load().mask
+    mask.size = canvas_size
+
+    return (
+        clip.set_mask(mask)
+        .set_start(overlay.start)
+        .set_duration(overlay.duration)
+        .set_position(lambda t: overlay.load().pos)
+    )
+
+
+def slide_clip(slide: Slide, size: tuple[int, int]) -> VideoClip:
+    """
+    슬라이드를 moviepy 클립으로 감싼다 (moviepy 렌더 경로용).
+    - 정지 슬라이드: ImageClip
+    - motion 슬라이드: t마다 crop 창을 계산해 KenBurnsRenderer로 리샘플 (moviepy resize 없음)
+    """
+    if slide.motion is None:
+        return ImageClip(slide.image).set_duration(slide.duration)
+
+    src_h, src_w = slide.image.shape[:2]
+    renderer = KenBurnsRenderer(slide.image, size)
+
+    def make_frame(t):
+        window = plan_windows(slide.motion, (src_w, src_h), np.array([t / float(slide.duration)]))[0]
+        # 렌더러 버퍼는 다음 프레임에서 재사용되므로 moviepy에는 사본을 넘긴다
+        return renderer.render(window).copy()
+
+    clip = VideoClip()
+    clip.make_frame = make_frame
+    clip.size = size
+    return clip.set_duration(slide.duration)
+
+
+def slideshow_clip(slides: list[Slide], size: tuple[int, int], transition: Transition | None = None) -> VideoClip:
+    """
+    슬라이드들을 이어 붙인 배경 클립 (moviepy 렌더 경로용).
+    - 전환 없음: 슬라이드 클립 concatenate (기존과 같은 프레임)
+    - 전환 있음: 배경 전용 Timeline을 compositor로 평가 (전환 구간만 블렌드, 나머지는 원본 그대로)
+      Ken Burns 렌더러/전환 블렌더는 클립 하나에서 재사용한다 (프레임마다 버퍼를 새로 잡지 않음)
+    """
+    if transition is None:
+        return concatenate_videoclips([slide_clip(s, size) for s in slides], method="compose")
+
+    timeline = Timeline(size=size, slides=slides, transition=transition)
+    buffers = DynamicBuffers(timeline)
+    clip = VideoClip()
+    clip.make_frame = lambda t: compose_frame(timeline, t, buffers=buffers)
+    clip.size = size
+    return clip.set_duration(timeline.duration)
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from types import CodeType
+from typing import Callable
+
+import numpy as np
+from PIL import Image, PngImagePlugin
+
+from config import settings
+
+# 렌더러 본문 밖(폰트 맞춤/외곽선 헬퍼 등)의 변경으로 출력이 달라지면 올려서 기존 캐시를 무효화한다
+OVERLAY_CACHE_VERSION = 1
+
+Rendered = tuple[np.ndarray, tuple[int, int]]
+
+
+class OverlayDiskCache:
+    """
+    렌더된 자막 오버레이(RGBA 박스 + 배치 위치)의 content-addressed PNG 캐시.
+    - 파일명 = sha256(렌더 파라미터) → 같은 문구/폰트/크기/캔버스/스타일이면 실행이 달라도 재사용
+    - 배치 위치 (x, y)는 PNG 텍스트 청크에 같이 저장
+    - 총 용량이 max_bytes를 넘으면 가장 오래 안 쓴(mtime) 파일부터 지운다 (hit 시 mtime 갱신)
+    - 쓰기는 임시 파일 + os.replace 라서 병렬 렌더 워커가 같은 디렉터리를 써도 깨진 파일이 보이지 않는다
+    """
+
+    def __init__(self, root: Path, max_bytes: int):
+        self.root = Path(root)
+        self.max_bytes = max(0, int(max_bytes))
+        self.counters = {"hits": 0, "misses": 0, "writes": 0, "evicted": 0}
+        self._lock = threading.Lock()
+        self._index: OrderedDict[str, int] | None = None  # key -> bytes (오래된 순)
+
+    @staticmethod
+    def key(params: dict) -> str:
+        raw = json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.png"
+
+    def _load_index(self) -> OrderedDict[str, int]:
+        if self._index is None:
+            entries = []
+            if self.root.exists():
+                for p in self.root.glob("*.png"):
+                    try:
+                        st = p.stat()
+                    except OSError:
+                        continue
+                    entries.append((st.st_mtime, p.stem, st.st_size))
+            entries.sort()
+            self._index = OrderedDict((k, size) for _, k, size in entries)
+        return self._index
+
+    def get(self, key: str) -> Rendered | None:
+        path = self._path(key)
+        try:
+            with Image.open(path) as im:
+                im.load()
+                x, y = (int(v) for v in im.text["pos"].split(","))
+                image = np.array(im.convert("RGBA"))
+            os.utime(path)
+        except Exception:
+            with self._lock:
+                self.counters["misses"] += 1
+            return None
+
+        with self._lock:
+            self.counters["hits"] += 1
+            index = self._load_index()
+            if key in index:
+                index.move_to_end(key)
+        return image, (x, y)
+
+    def put(self, key: str, image: np.ndarray, pos: tuple[int, int]) -> None:
+        path = self._path(key)
+        tmp = path.with_name(f".{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+        info = PngImagePlugin.PngInfo()
+        info.add_text("pos", f"{int(pos[0])},{int(pos[1])}")
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            # 자막 박스는 대부분 단색이라 가장 빠른 압축으로도 충분히 작다
+            Image.fromarray(image, "RGBA").save(tmp, format="PNG", pnginfo=info, compress_level=1)
+            os.replace(tmp, path)
+            size = path.stat().st_size
+        except OSError as e:
+            logging.getLogger("auto_youtube.render.overlay_cache").warning(
+                "overlay_cache_write_fail path=%s err=%s", path, e
+            )
+            tmp.unlink(missing_ok=True)
+            return
+
+        with self._lock:
+            self.counters["writes"] += 1
+            index = self._load_index()
+            index[key] = size
+            index.move_to_end(key)
+            self._evict(index)
+
+    def _evict(self, index: OrderedDict[str, int]) -> None:
+        total = sum(index.values())
+        while index and total > self.max_bytes:
+            key, size = index.popitem(last=False)
+            total -= size
+            try:
+                self._path(key).unlink()
+                self.counters["evicted"] += 1
+            except FileNotFoundError:
+                pass
+
+
+_cache: OverlayDiskCache | None = None
+_cache_lock = threading.Lock()
+# 캐시 사용 여부와 무관하게 실제 래스터화 횟수/시간 (render_metrics 용)
+_render_counters = {"renders": 0, "render_ms": 0}
+
+
+def get_overlay_cache() -> OverlayDiskCache | None:
+    """settings 기반 프로세스 전역 캐시 (OVERLAY_CACHE_ENABLED=False면 None)"""
+    global _cache
+    if not bool(getattr(settings, "OVERLAY_CACHE_ENABLED", True)):
+        return None
+    with _cache_lock:
+        if _cache is None:
+            root = Path(getattr(settings, "OVERLAY_CACHE_DIR", Path(settings.OUTPUT_DIR) / "overlay_cache"))
+            max_mb = float(getattr(settings, "OVERLAY_CACHE_MAX_MB", 256))
+            _cache = OverlayDiskCache(root, int(max_mb * 1024 * 1024))
+        return _cache
+
+
+def _font_fingerprint(font_path: str | None) -> list:
+    # 같은 경로라도 폰트 파일이 바뀌면 다른 키가 되도록 크기/수정 시각을 포함
+    if not font_path:
+        return ["default"]
+    try:
+        st = os.stat(font_path)
+    except OSError:
+        return [str(font_path), "missing"]
+    return [str(font_path), st.st_size, st.st_mtime_ns]
+
+
+def _code_bytes(code: CodeType) -> bytes:
+    # 중첩 함수/lambda/컴프리헨션의 code 객체는 repr에 메모리 주소가 들어가서 프로세스마다 키가 바뀐다
+    # → 바이트코드 + 이름 + code가 아닌 상수만 재귀로 모은다
+    parts = [code.co_code, repr(code.co_names).encode("utf-8")]
+    for const in code.co_consts:
+        parts.append(b"<code>" + _code_bytes(const) if isinstance(const, CodeType) else repr(const).encode("utf-8"))
+    return b"\0".join(parts)
+
+
+def _code_fingerprint(render: Callable) -> str:
+    code = getattr(render, "__code__", None)
+    if code is None:
+        return ""
+    return hashlib.sha256(_code_bytes(code)).hexdigest()[:16]
+
+
+def cached_overlay(render: Callable[..., Rendered], *, settings_keys: tuple[str, ...] = (), **kwargs) -> Rendered:
+    """
+    render(**kwargs) 결과를 디스크 캐시에서 찾고, 없으면 렌더 후 저장한다.
+    - 키: 렌더러 이름 + 본문 코드 해시 + kwargs(문구/캔버스/폰트 크기 등) + 폰트 파일 + settings_keys 값
+    - settings_keys: 렌더러가 내부에서 읽는 settings 이름 (외곽선 두께, 박스 비율 등)
+    - LazyOverlay에 functools.partial(cached_overlay, make_subtitle_image, ...) 형태로 넘긴다
+      (모듈 함수 + partial이라 병렬 렌더 워커로 pickle 가능)
+    """
+    cache = get_overlay_cache()
+    if cache is None:
+        return _timed_render(render, kwargs)
+
+    params = {
+        "version": OVERLAY_CACHE_VERSION,
+        "render": f"{render.__module__}.{render.__qualname__}",
+        "code": _code_fingerprint(render),
+        "kwargs": kwargs,
+        "font": _font_fingerprint(kwargs.get("font_path")),
+        "settings": {k: getattr(settings, k, None) for k in settings_keys},
+    }
+    key = cache.key(params)
+    hit = cache.get(key)
+    if hit is not None:
+        return hit
+
+    image, pos = _timed_render(render, kwargs)
+    cache.put(key, image, pos)
+    return image, pos
+
+
+def _timed_render(render: Callable[..., Rendered], kwargs: dict) -> Rendered:
+    t0 = time.perf_counter()
+    out = render(**kwargs)
+    elapsed_ms = int(round((time.perf_counter() - t0) * 1000))
+    with _cache_lock:
+        _render_counters["renders"] += 1
+        _render_counters["render_ms"] += elapsed_ms
+    return out
+
+
+def overlay_cache_stats() -> dict[str, int]:
+    """현재 프로세스의 누적 카운터 사본 (캐시 카운터는 비활성이면 0) + 래스터화 횟수/시간"""
+    with _cache_lock:
+        rendered = dict(_render_counters)
+    cache = _cache
+    if cache is None:
+        return {"hits": 0, "misses": 0, "writes": 0, "evicted": 0, **rendered}
+    with cache._lock:
+        return {**cache.counters, **rendered}
+
+
+def stats_delta(after: dict[str, int], before: dict[str, int]) -> dict[str, int]:
+    return {k: after.get(k, 0) - before.get(k, 0) for k in after}
+
+
+def merge_overlay_cache_stats(delta: dict[str, int]) -> None:
+    """병렬 렌더 워커에서 돌려받은 카운터를 이 프로세스 카운터에 더한다 (실행 단위 로그용)"""
+    with _cache_lock:
+        for k in _render_counters:
+            _render_counters[k] += int(delta.get(k, 0))
+    cache = get_overlay_cache()
+    if cache is None:
+        return
+    with cache._lock:
+        for k, v in delta.items():
+            if k not in _render_counters:
+                cache.counters[k] = cache.counters.get(k, 0) + int(v)
+
+
+def log_overlay_cache_stats(logger: logging.Logger, since: dict[str, int]) -> None:
+    """since(실행 시작 시점 overlay_cache_stats()) 이후의 hit rate를 로그로 남긴다"""
+    d = stats_delta(overlay_cache_stats(), since)
+    lookups = d["hits"] + d["misses"]
+    logger.info(
+        "overlay_cache hits=%s misses=%s hit_rate=%.1f%% writes=%s evicted=%s",
+        d["hits"],
+        d["misses"],
+        (100.0 * d["hits"] / lookups) if lookups else 0.0,
+        d["writes"],
+        d["evicted"],
+    )
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from config import settings
+
+
+@dataclass(frozen=True)
+class EncodeProfile:
+    """
+    인코딩 프로파일 (settings.ENCODE_PROFILES 한 항목)
+    - preset/crf/tune/threads: libx264 옵션 (None이면 ffmpeg 기본값)
+    - scale: 출력 해상도 배율 (폰트 크기도 같이 줄인다)
+    - fps: None이면 settings.VIDEO_FPS
+    """
+
+    name: str
+    preset: str = "medium"
+    crf: int | None = None
+    tune: str | None = None
+    threads: int | None = None
+    scale: float = 1.0
+    fps: float | None = None
+
+    @property
+    def video_fps(self) -> float:
+        return float(self.fps or settings.VIDEO_FPS)
+
+    def resolution(self, base: tuple[int, int]) -> tuple[int, int]:
+        # yuv420p는 짝수 해상도만 허용
+        w, h = base
+        return (max(2, int(w * self.scale) // 2 * 2), max(2, int(h * self.scale) // 2 * 2))
+
+    def font_size(self, base: int) -> int:
+        return max(8, int(round(base * self.scale)))
+
+    def x264_params(self) -> list[str]:
+        """preset/threads 외 libx264 옵션 (moviepy ffmpeg_params 와 같은 형식)"""
+        args: list[str] = []
+        if self.crf is not None:
+            args.extend(["-crf", str(self.crf)])
+        if self.tune:
+            args.extend(["-tune", self.tune])
+        return args
+
+    def video_args(self) -> list[str]:
+        args = ["-vcodec", "libx264", "-preset", self.preset, *self.x264_params()]
+        if self.threads is not None:
+            args.extend(["-threads", str(self.threads)])
+        return args
+
+    def moviepy_kwargs(self) -> dict:
+        return {
+            "fps": self.video_fps,
+            "preset": self.preset,
+            "threads": self.threads,
+            "ffmpeg_params": self.x264_params() or None,
+        }
+
+
+def get_profile(name: str | None = None) -> EncodeProfile:
+    """name이 없으면 settings.ENCODE_PROFILE 을 사용한다."""
+    name = name or str(getattr(settings, "ENCODE_PROFILE", "publish"))
+    profiles = getattr(settings, "ENCODE_PROFILES", {})
+    if name not in profiles:
+        raise ValueError(f"unknown encode profile: {name!r} (choices={sorted(profiles)})")
+    return EncodeProfile(name=name, **profiles[name])
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import logging
+import math
+import threading
+from collections import OrderedDict
+from io import BytesIO
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from config import settings
+
+from app.utils.artifacts import fetch_image_bytes
+
+RESAMPLE_FILTERS = {
+    "nearest": Image.Resampling.NEAREST,
+    "box": Image.Resampling.BOX,
+    "bilinear": Image.Resampling.BILINEAR,
+    "hamming": Image.Resampling.HAMMING,
+    "bicubic": Image.Resampling.BICUBIC,
+    "lanczos": Image.Resampling.LANCZOS,
+}
+FIT_MODES = ("cover", "stretch")
+
+
+def open_source(src: str, timeout: int = 15) -> Image.Image:
+    """로컬 파일이면 그대로 열고, 아니면 URL을 (공유 이미지 저장소를 거쳐) 받아서 연다 (아직 디코드 전)."""
+    p = Path(str(src))
+    if p.exists():
+        return Image.open(str(p))
+    raw, _ = fetch_image_bytes(src, timeout=timeout)
+    return Image.open(BytesIO(raw))
+
+
+def _cover_box(src_size: tuple[int, int], dst_size: tuple[int, int]) -> tuple[float, float, float, float]:
+    """dst 비율에 맞춰 src 가운데를 잘라낼 영역 (left, top, right, bottom)"""
+    sw, sh = src_size
+    dw, dh = dst_size
+    scale = max(dw / sw, dh / sh)
+    cw, ch = dw / scale, dh / scale
+    # float 오차로 경계를 살짝 넘지 않게 원본 범위로 자른다 (resize box는 음수/초과를 거부)
+    left = max(0.0, (sw - cw) / 2)
+    top = max(0.0, (sh - ch) / 2)
+    return (left, top, min(float(sw), left + cw), min(float(sh), top + ch))
+
+
+def _resolve_options(fit: str | None, resample: str | None) -> tuple[str, str]:
+    fit = fit or str(getattr(settings, "SLIDE_FIT", "cover"))
+    resample = resample or str(getattr(settings, "SLIDE_RESAMPLE", "bicubic"))
+    if fit not in FIT_MODES:
+        raise ValueError(f"unknown fit mode: {fit!r} (choices={FIT_MODES})")
+    if resample not in RESAMPLE_FILTERS:
+        raise ValueError(f"unknown resample filter: {resample!r} (choices={sorted(RESAMPLE_FILTERS)})")
+    return fit, resample
+
+
+def _draft_request(src_size: tuple[int, int], size: tuple[int, int], fit: str) -> tuple[int, int]:
+    """size로 맞추기 위해 원본에서 최소한 필요한 디코드 크기"""
+    dw, dh = size
+    sw, sh = src_size
+    if fit == "cover":
+        scale = max(dw / sw, dh / sh)
+        return (math.ceil(sw * scale), math.ceil(sh * scale))
+    return (dw, dh)
+
+
+def _fit_decoded(img: Image.Image, size: tuple[int, int], fit: str, resample: str) -> Image.Image:
+    box = _cover_box(img.size, size) if fit == "cover" else None
+    return img.resize(size, RESAMPLE_FILTERS[resample], box=box, reducing_gap=3.0)
+
+
+def fit_image(
+    img: Image.Image,
+    size: tuple[int, int],
+    *,
+    fit: str | None = None,
+    resample: str | None = None,
+) -> Image.Image:
+    """
+    img를 size(width, height)에 맞춘다.
+    - JPEG는 draft()로 목표 크기 근처(1/2, 1/4, 1/8)에서 디코드해 시간/메모리를 줄인다
+    - 그 외 포맷은 resize(reducing_gap)로 정수배 reduce 후 리샘플
+    - fit="cover": 비율 유지 + 가운데 크롭, fit="stretch": 예전처럼 비율 무시
+    """
+    fit, resample = _resolve_options(fit, resample)
+    # draft는 요청 크기 이상을 보장하는 가장 작은 스케일을 고른다 (JPEG 외에는 no-op)
+    img.draft("RGB", _draft_request(img.size, size, fit))
+    img = img.convert("RGB")
+    return _fit_decoded(img, size, fit, resample)
+
+
+def load_slide(src: str, size: tuple[int, int], *, fit: str | None = None, resample: str | None = None) -> np.ndarray:
+    """슬라이드 한 장을 size에 맞춘 HxWx3 uint8 배열로 로드한다."""
+    logger = logging.getLogger("auto_youtube.render.slides")
+    img = open_source(src)
+    src_size = img.size
+    out = fit_image(img, size, fit=fit, resample=resample)
+    logger.debug("slide_loaded src=%s src_size=%s size=%s", src, src_size, size)
+    return np.asarray(out)
+
+
+class SlidePool:
+    """
+    프로세스 전역 디코드 이미지 풀 (롱폼/숏츠 등 여러 포맷이 같은 원본을 공유).
+    - ("fit", src, size, fit, resample): 최종 슬라이드 배열 → 같은 포맷 안의 반복 슬라이드/재실행
+    - ("src", src): 디코드된 원본 RGB → 다른 해상도/크롭 요청은 디코드 없이 리샘플만
+      (JPEG는 요청 크기 근처로 draft 디코드하므로, 더 큰 요청이 오면 그 크기로 다시 디코드해서 교체)
+    - ("raw", src): URL 원본 바이트 → 재디코드할 때 다시 다운로드하지 않도록
+    - 항목 크기(바이트) 합이 max_bytes를 넘으면 가장 오래 안 쓴 것부터 버린다
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max(0, int(max_bytes))
+        self.counters = {"fit_hits": 0, "src_hits": 0, "decodes": 0, "downloads": 0, "evicted": 0}
+        self._lock = threading.Lock()
+        self._items: OrderedDict[tuple, tuple[object, int]] = OrderedDict()
+        self._bytes = 0
+
+    def _get(self, key: tuple):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            self._items.move_to_end(key)
+            return item[0]
+
+    def _put(self, key: tuple, value: object, nbytes: int) -> None:
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._items[key] = (value, nbytes)
+            self._bytes += nbytes
+            # 방금 넣은 항목 하나는 예산을 넘어도 남긴다 (호출자가 바로 쓰므로)
+            while self._bytes > self.max_bytes and len(self._items) > 1:
+                _, (_, size) = self._items.popitem(last=False)
+                self._bytes -= size
+                self.counters["evicted"] += 1
+
+    def _open(self, src: str) -> Image.Image:
+        if Path(str(src)).exists():
+            return Image.open(str(src))
+        raw = self._get(("raw", src))
+        if raw is None:
+            # 실행 간 공유 이미지 저장소에 있으면 네트워크 없이 읽는다 (downloads는 실제 다운로드만 센다)
+            raw, downloaded = fetch_image_bytes(src)
+            if downloaded:
+                self.counters["downloads"] += 1
+            self._put(("raw", src), raw, len(raw))
+        return Image.open(BytesIO(raw))
+
+    def _decoded(self, src: str, size: tuple[int, int], fit: str) -> Image.Image:
+        cached = self._get(("src", src))
+        if cached is not None:
+            img, full_size = cached
+            need = _draft_request(full_size, size, fit)
+            if img.size == full_size or (img.size[0] >= need[0] and img.size[1] >= need[1]):
+                self.counters["src_hits"] += 1
+                return img
+
+        img = self._open(src)
+        full_size = img.size
+        img.draft("RGB", _draft_request(full_size, size, fit))
+        img = img.convert("RGB")
+        self.counters["decodes"] += 1
+        self._put(("src", src), (img, full_size), img.width * img.height * 3)
+        return img
+
+    def load(
+        self,
+        src: str,
+        size: tuple[int, int],
+        *,
+        fit: str | None = None,
+        resample: str | None = None,
+    ) -> np.ndarray:
+        """load_slide와 같은 HxWx3 uint8 배열 (결과 배열은 공유되므로 수정하지 말 것)"""
+        fit, resample = _resolve_options(fit, resample)
+        key = ("fit", str(src), tuple(size), fit, resample)
+        arr = self._get(key)
+        if arr is not None:
+            self.counters["fit_hits"] += 1
+            return arr
+
+        img = self._decoded(str(src), size, fit)
+        arr = np.asarray(_fit_decoded(img, size, fit, resample))
+        arr.flags.writeable = False
+        self._put(key, arr, arr.nbytes)
+        logging.getLogger("auto_youtube.render.slides").debug(
+            "slide_pooled src=%s size=%s fit=%s", src, size, fit
+        )
+        return arr
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {**self.counters, "items": len(self._items), "bytes": self._bytes}
+
+
+_pool: SlidePool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_slide_pool() -> SlidePool:
+    """settings.SLIDE_POOL_MAX_MB 예산의 프로세스 전역 SlidePool"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            max_mb = float(getattr(settings, "SLIDE_POOL_MAX_MB", 512))
+            _pool = SlidePool(int(max_mb * 1024 * 1024))
+        return _pool
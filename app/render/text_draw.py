@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from PIL import ImageDraw, ImageFont
+
+Color = tuple[int, ...]
+
+
+def draw_outlined_text(
+    draw: ImageDraw.ImageDraw,
+    xy: tuple[float, float],
+    text: str,
+    font: ImageFont.ImageFont,
+    *,
+    outline_width: int,
+    fill: Color = (255, 255, 255, 255),
+    outline_fill: Color = (0, 0, 0, 255),
+) -> None:
+    """
+    외곽선 글자를 한 번에 그린다.
+    - 예전 방식(8방향 오프셋으로 검은 글자 8번 + 흰 글자 1번)을 Pillow stroke_width/stroke_fill로 대체
+      글리프 래스터화가 9번에서 (외곽선 마스크 + 본문 마스크) 한 번의 text 호출로 줄어든다
+    - 외곽선은 오프셋 사각형 대신 두께 outline_width의 둥근 획이라 모서리가 더 매끈하다
+    - outline_width <= 0 이면 외곽선 없이 본문만 그린다
+    """
+    if not text:
+        return
+    width = max(0, int(outline_width))
+    if width:
+        draw.text(xy, text, font=font, fill=fill, stroke_width=width, stroke_fill=outline_fill)
+    else:
+        draw.text(xy, text, font=font, fill=fill)
+
+
+def outline_padding(outline_width: int, minimum: int = 4) -> int:
+    """글자 위아래로 외곽선이 삐져나갈 수 있는 여유(px) — 박스 영역만 잘라 낼 때 사용"""
+    return max(int(minimum), max(0, int(outline_width)) + 1)
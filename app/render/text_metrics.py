@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import threading
+import weakref
+
+from PIL import ImageFont
+
+
+class TextMeasure:
+    """
+    폰트 하나에 대한 글자 폭 측정기.
+    - 글자별 advance와 글자 쌍별 커닝 보정값을 캐시해 두고 문자열 폭을 합으로 계산한다
+      폭(s) = sum(advance(c)) + sum(kern(s[i], s[i+1]))
+    - Pillow 기본 레이아웃은 글리프 advance(26.6 고정소수점) + 쌍 커닝을 더하는 방식이라
+      draw.textlength와 같은 값이 나온다 (raqm 레이아웃의 합자/셰이핑은 근사)
+    - 폭 계산이 O(문자 수)라, 앞에서부터 늘려 가며 재는 래핑이 선형이 된다
+    """
+
+    def __init__(self, font: ImageFont.ImageFont):
+        self.font = font
+        self._advance: dict[str, float] = {}
+        self._kern: dict[tuple[str, str], float] = {}
+
+    def advance(self, ch: str) -> float:
+        adv = self._advance.get(ch)
+        if adv is None:
+            adv = self._advance[ch] = float(self.font.getlength(ch))
+        return adv
+
+    def kern(self, a: str, b: str) -> float:
+        key = (a, b)
+        k = self._kern.get(key)
+        if k is None:
+            k = float(self.font.getlength(a + b)) - self.advance(a) - self.advance(b)
+            self._kern[key] = k
+        return k
+
+    def width(self, text: str) -> float:
+        """draw.textlength(text, font) 대응"""
+        return self.extend(0.0, "", text)
+
+    def extend(self, width: float, last: str, text: str) -> float:
+        """폭이 width이고 마지막 글자가 last인 문자열 뒤에 text를 붙였을 때의 폭"""
+        prev = last
+        for ch in text:
+            width += self.advance(ch)
+            if prev:
+                width += self.kern(prev, ch)
+            prev = ch
+        return width
+
+    def prefix_widths(self, text: str) -> list[float]:
+        """out[j] = 폭(text[:j]), 길이 len(text)+1"""
+        out = [0.0]
+        w = 0.0
+        prev = ""
+        for ch in text:
+            w += self.advance(ch)
+            if prev:
+                w += self.kern(prev, ch)
+            out.append(w)
+            prev = ch
+        return out
+
+    def span_width(self, text: str, prefix: list[float], i: int, j: int) -> float:
+        """폭(text[i:j]) — prefix 합의 차에서 text[i-1]과 text[i] 사이 커닝만 빼 준다"""
+        if j <= i:
+            return 0.0
+        w = prefix[j] - prefix[i]
+        if i > 0:
+            w -= self.kern(text[i - 1], text[i])
+        return w
+
+    def wrap_words(self, line: str, max_width: float) -> list[str]:
+        """
+        공백 단위 greedy 래핑 (기존 루프와 같은 결과):
+            test = (cur + " " + word).strip()
+            폭(test) <= max_width 이면 이어 붙이고, 아니면 cur를 내보내고 word로 새 줄
+        test가 cur로 시작하면 cur의 폭에 덧붙인 부분만 더해 잰다.
+        """
+        lines: list[str] = []
+        cur = ""
+        cur_w = 0.0
+        for word in line.split(" "):
+            test = (cur + " " + word).strip()
+            if cur and test.startswith(cur):
+                tw = self.extend(cur_w, cur[-1], test[len(cur):])
+            else:
+                tw = self.width(test)
+            if tw <= max_width:
+                cur, cur_w = test, tw
+            else:
+                if cur:
+                    lines.append(cur)
+                cur = word
+                cur_w = self.width(cur)
+        if cur:
+            lines.append(cur)
+        return lines
+
+    def hard_wrap(self, text: str, max_width: float) -> list[str]:
+        """
+        문자 단위 하드 래핑 (공백 없는 긴 한글 토큰용, 기존 루프와 같은 결과):
+            buf + ch 폭이 max_width 이하면 이어 붙이고, 아니면 buf를 내보내고 ch로 새 줄
+        prefix 합으로 각 후보 폭을 O(1)에 잰다.
+        """
+        lines: list[str] = []
+        prefix = self.prefix_widths(text)
+        start = 0
+        for j in range(1, len(text) + 1):
+            if j - 1 > start and self.span_width(text, prefix, start, j) > max_width:
+                lines.append(text[start:j - 1])
+                start = j - 1
+        if start < len(text):
+            lines.append(text[start:])
+        return lines
+
+
+_lock = threading.Lock()
+_measures: weakref.WeakKeyDictionary[ImageFont.ImageFont, TextMeasure] = weakref.WeakKeyDictionary()
+
+
+def get_measure(font: ImageFont.ImageFont) -> TextMeasure:
+    """
+    폰트 객체별 TextMeasure (get_font 레지스트리의 폰트와 수명을 같이한다).
+    폰트가 레지스트리에서 밀려나 사라지면 측정 캐시도 같이 정리된다.
+    """
+    with _lock:
+        m = _measures.get(font)
+        if m is None:
+            m = _measures[font] = TextMeasure(font)
+        return m
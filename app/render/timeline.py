@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+import bisect
+import math
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from functools import cached_property
+from typing import Callable
+
+import numpy as np
+
+from app.render.kenburns import KenBurns
+from app.render.transitions import Transition
+
+
+@dataclass(frozen=True)
+class Slide:
+    """
+    배경 슬라이드 한 장 (HxWx3 uint8).
+    - motion이 있으면 image는 오버샘플 원본이고, 프레임마다 motion의 crop 창을 출력 크기로 리샘플한다
+    """
+
+    image: np.ndarray
+    duration: float
+    motion: KenBurns | None = None
+
+
+@dataclass
+class Overlay:
+    """
+    start~end 구간에만 보이는 RGBA 오버레이(자막 등).
+    - image: hxwx4 uint8 (자막 박스처럼 캔버스보다 작아도 됨)
+    - pos: 캔버스 기준 image 좌상단 위치 (x, y)
+    - rows: image 안에서 알파가 0이 아닌 행 범위 [y0, y1) (합성 시 이 구간만 계산)
+    """
+
+    image: np.ndarray
+    start: float
+    duration: float
+    pos: tuple[int, int] = (0, 0)
+    rows: tuple[int, int] = field(init=False)
+
+    def __post_init__(self):
+        nz = np.flatnonzero(self.image[:, :, 3].any(axis=1))
+        self.rows = (int(nz[0]), int(nz[-1]) + 1) if nz.size else (0, 0)
+
+    @property
+    def end(self) -> float:
+        return self.start + self.duration
+
+    def is_playing(self, t: float) -> bool:
+        # moviepy Clip.is_playing과 같은 규칙: start <= t < end
+        return self.start <= t < self.end
+
+    def load(self) -> "Overlay":
+        """이미 렌더된 오버레이 (LazyOverlay와 같은 인터페이스)"""
+        return self
+
+    @cached_property
+    def mask(self) -> np.ndarray:
+        # moviepy ImageClip(transparent=True)과 같은 float 마스크 (moviepy 경로 전용)
+        return self.image[:, :, 3] / 255.0
+
+
+class OverlayLRU:
+    """
+    LazyOverlay들이 공유하는 렌더 결과 LRU.
+    자막은 시간 순서대로 한 번씩만 쓰이므로 현재/다음 세그먼트 정도만 들고 있으면 된다.
+    """
+
+    def __init__(self, max_items: int = 2):
+        self.max_items = max(1, int(max_items))
+        self.renders = 0
+        self._items: OrderedDict[object, Overlay] = OrderedDict()
+
+    def get(self, key: object, build: Callable[[], Overlay]) -> Overlay:
+        item = self._items.get(key)
+        if item is not None:
+            self._items.move_to_end(key)
+            return item
+        item = build()
+        self.renders += 1
+        self._items[key] = item
+        if len(self._items) > self.max_items:
+            self._items.popitem(last=False)
+        return item
+
+
+class LazyOverlay:
+    """
+    타임라인이 처음 도달했을 때 render()로 이미지를 만드는 오버레이.
+    - render: () -> (rgba, (x, y)) (예: functools.partial(make_subtitle_image, ...))
+    - 렌더 결과는 공유 OverlayLRU에만 보관되어 자막 수와 무관하게 메모리가 일정하다
+    """
+
+    def __init__(
+        self,
+        render: Callable[[], tuple[np.ndarray, tuple[int, int]]],
+        start: float,
+        duration: float,
+        lru: OverlayLRU,
+    ):
+        self.render = render
+        self.start = start
+        self.duration = duration
+        self.lru = lru
+
+    @property
+    def end(self) -> float:
+        return self.start + self.duration
+
+    def is_playing(self, t: float) -> bool:
+        return self.start <= t < self.end
+
+    def load(self) -> Overlay:
+        def build() -> Overlay:
+            image, pos = self.render()
+            return Overlay(image, self.start, self.duration, pos=pos)
+
+        return self.lru.get(self, build)
+
+
+@dataclass(frozen=True)
+class Interval:
+    """
+    프레임 [start_frame, end_frame) 동안 (슬라이드, 오버레이) 조합이 변하지 않는 구간.
+    슬라이드에 motion이 없고 전환 구간(prev_slide)도 아니면 화면 전체가 정지 구간이다.
+    """
+
+    start_frame: int
+    end_frame: int
+    slide: int
+    overlays: tuple[int, ...]
+    # start_frame 시점의 슬라이드 안 시각(초) - 움직이는 슬라이드(motion)의 진행률 계산용
+    slide_time: float = 0.0
+    # 전환 구간이면 이전 슬라이드 index (이 구간 동안 prev_slide -> slide 로 넘어간다)
+    prev_slide: int | None = None
+
+    @property
+    def frames(self) -> int:
+        return self.end_frame - self.start_frame
+
+    @property
+    def key(self) -> tuple[int, tuple[int, ...]]:
+        return (self.slide, self.overlays)
+
+
+@dataclass
+class Timeline:
+    """
+    슬라이드(연속 배치) + 시간 구간 오버레이로 이루어진 타임라인.
+    - duration을 주지 않으면 슬라이드 길이의 합
+    - transition이 있으면 각 슬라이드(첫 장 제외) 시작부터 전환 길이만큼 이전 슬라이드와 섞는다
+    """
+
+    size: tuple[int, int]
+    slides: list[Slide]
+    overlays: list[Overlay | LazyOverlay] = field(default_factory=list)
+    duration: float | None = None
+    transition: Transition | None = None
+    _starts: list[float] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        if not self.slides:
+            raise ValueError("timeline needs at least one slide")
+        starts = [0.0]
+        for s in self.slides[:-1]:
+            starts.append(starts[-1] + float(s.duration))
+        self._starts = starts
+        total = starts[-1] + float(self.slides[-1].duration)
+        self.duration = total if self.duration is None else min(float(self.duration), total)
+
+    def slide_start(self, index: int) -> float:
+        return self._starts[index]
+
+    def slide_index_at(self, t: float) -> int:
+        return max(0, bisect.bisect_right(self._starts, t) - 1)
+
+    def transition_length(self, prev: int, slide: int) -> float:
+        """prev -> slide 전환 길이(초): 설정 길이를 두 슬라이드 중 짧은 쪽 길이로 제한"""
+        if self.transition is None:
+            return 0.0
+        return min(
+            float(self.transition.duration),
+            float(self.slides[prev].duration),
+            float(self.slides[slide].duration),
+        )
+
+    def prev_slide_at(self, t: float) -> int | None:
+        """t가 전환 구간 안이면 이전 슬라이드 index, 아니면 None"""
+        i = self.slide_index_at(t)
+        if i == 0 or t - self._starts[i] >= self.transition_length(i - 1, i):
+            return None
+        return i - 1
+
+    def is_static(self, interval: Interval) -> bool:
+        """구간 안의 모든 프레임이 같은지 (motion 슬라이드 / 전환 구간이 아닌지)"""
+        return interval.prev_slide is None and self.slides[interval.slide].motion is None
+
+    def overlay_indices_at(self, t: float) -> tuple[int, ...]:
+        return tuple(i for i, o in enumerate(self.overlays) if o.is_playing(t))
+
+    def frame_count(self, fps: float) -> int:
+        # moviepy iter_frames(np.arange(0, duration, 1/fps))와 같은 프레임 수
+        return max(1, math.ceil(self.duration * fps - 1e-9))
+
+    def key_at(self, t: float) -> tuple[int, tuple[int, ...]]:
+        return (self.slide_index_at(t), self.overlay_indices_at(t))
+
+    def change_points(self) -> list[float]:
+        """화면 구성이 바뀔 수 있는 시각(초) 목록"""
+        points = {0.0, float(self.duration)}
+        points.update(self._starts)
+        for i in range(1, len(self.slides)):
+            points.add(self._starts[i] + self.transition_length(i - 1, i))
+        for o in self.overlays:
+            points.add(o.start)
+            points.add(o.end)
+        return sorted(p for p in points if 0.0 <= p <= self.duration)
+
+    def intervals(self, fps: float) -> list[Interval]:
+        """
+        change point 기준으로 타임라인을 구간 목록으로 나눈다.
+        - 프레임 i는 t=i/fps 시점의 (슬라이드, 오버레이, 전환 여부) 조합을 보여준다
+        - float 경계 오차를 피하려고 change point 주변 프레임을 직접 평가한다
+        """
+        n = self.frame_count(fps)
+        candidates = {0}
+        for p in self.change_points():
+            f = int(math.floor(p * fps))
+            candidates.update(range(f - 1, f + 3))
+        frames = sorted(f for f in candidates if 0 <= f < n)
+
+        def key(t: float) -> tuple:
+            return (*self.key_at(t), self.prev_slide_at(t))
+
+        out: list[Interval] = []
+        cur_start = 0
+        cur_key = key(0.0)
+        for f in frames[1:]:
+            k = key(f / fps)
+            if k != cur_key:
+                out.append(Interval(cur_start, f, cur_key[0], cur_key[1], prev_slide=cur_key[2]))
+                cur_start, cur_key = f, k
+        out.append(Interval(cur_start, n, cur_key[0], cur_key[1], prev_slide=cur_key[2]))
+        return [replace(iv, slide_time=iv.start_frame / fps - self.slide_start(iv.slide)) for iv in out]
+
+    def subset(self, intervals: list[Interval], fps: float) -> tuple["Timeline", list[Interval]]:
+        """
+        intervals가 참조하는 슬라이드/오버레이만 담은 작은 Timeline과,
+        거기에 맞게 index/프레임 번호를 다시 매긴 intervals를 만든다 (워커 프로세스 전달용).
+        """
+        slide_map: dict[int, int] = {}
+        overlay_map: dict[int, int] = {}
+        slides: list[Slide] = []
+        overlays: list[Overlay | LazyOverlay] = []
+        base = intervals[0].start_frame
+        out: list[Interval] = []
+
+        for iv in intervals:
+            # 전환 구간이면 이전 슬라이드도 같이 넘긴다 (조각이 전환 구간부터 시작할 수 있음)
+            for s in (iv.prev_slide, iv.slide):
+                if s is not None and s not in slide_map:
+                    slide_map[s] = len(slides)
+                    slides.append(self.slides[s])
+            for o in iv.overlays:
+                if o not in overlay_map:
+                    overlay_map[o] = len(overlays)
+                    overlays.append(self.overlays[o])
+            out.append(
+                Interval(
+                    iv.start_frame - base,
+                    iv.end_frame - base,
+                    slide_map[iv.slide],
+                    tuple(overlay_map[o] for o in iv.overlays),
+                    iv.slide_time,
+                    None if iv.prev_slide is None else slide_map[iv.prev_slide],
+                )
+            )
+
+        sub = Timeline(size=self.size, slides=slides, overlays=overlays, transition=self.transition)
+        sub.duration = out[-1].end_frame / fps
+        return sub, out
+
+
+def split_intervals(intervals: list[Interval], chunks: int) -> list[list[Interval]]:
+    """
+    intervals를 프레임 수가 비슷한 chunks개 묶음으로 나눈다.
+    자르는 위치는 슬라이드가 바뀌는 경계로만 한정한다.
+    """
+    chunks = max(1, int(chunks))
+    total = sum(iv.frames for iv in intervals)
+    target = total / chunks
+
+    out: list[list[Interval]] = [[]]
+    acc = 0
+    for iv in intervals:
+        cur = out[-1]
+        if cur and iv.slide != cur[-1].slide and len(out) < chunks and acc >= target * len(out):
+            out.append([])
+        out[-1].append(iv)
+        acc += iv.frames
+    return out
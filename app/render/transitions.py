@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from config import settings
+
+TRANSITION_KINDS = ("crossfade", "wipe", "none")
+
+
+@dataclass(frozen=True)
+class Transition:
+    """
+    슬라이드 경계 전환.
+    - 다음 슬라이드 시작부터 duration초 동안 이전 슬라이드 → 다음 슬라이드로 넘어간다 (전체 길이는 그대로)
+    - kind: "crossfade"(알파 블렌드) / "wipe"(다음 슬라이드가 오른쪽에서 미끄러져 들어와 덮음)
+    """
+
+    kind: str = "crossfade"
+    duration: float = 0.5
+
+
+def configured_transition() -> Transition | None:
+    """settings.SLIDE_TRANSITION / SLIDE_TRANSITION_SEC 기준 전환 ("none"이거나 길이 0이면 None)"""
+    kind = str(getattr(settings, "SLIDE_TRANSITION", "none"))
+    if kind not in TRANSITION_KINDS:
+        raise ValueError(f"unknown slide transition: {kind!r} (choices={TRANSITION_KINDS})")
+    duration = float(getattr(settings, "SLIDE_TRANSITION_SEC", 0.5))
+    if kind == "none" or duration <= 0.0:
+        return None
+    return Transition(kind, duration)
+
+
+class TransitionBlender:
+    """
+    uint8 프레임 두 장을 전환 진행률에 맞춰 섞는다 (정수 연산만, 버퍼는 미리 잡아 재사용).
+    - crossfade: 8bit 고정소수점 a*(256-w) + b*w 를 uint16 안에서 계산
+    - wipe: 경계 열 위치만 계산해서 두 프레임의 열 구간을 복사 (곱셈 없음)
+    - blend()가 돌려준 배열은 다음 호출 때 덮어쓴다
+    """
+
+    def __init__(self, kind: str, size: tuple[int, int]):
+        if kind not in TRANSITION_KINDS or kind == "none":
+            raise ValueError(f"unknown slide transition: {kind!r}")
+        self.kind = kind
+        w, h = size
+        self.out = np.empty((h, w, 3), dtype=np.uint8)
+        if kind == "crossfade":
+            self._acc = np.empty((h, w * 3), dtype=np.uint16)
+            self._tmp = np.empty((h, w * 3), dtype=np.uint16)
+
+    def blend(self, a: np.ndarray, b: np.ndarray, progress: float) -> np.ndarray:
+        """progress 0.0 = a 그대로, 1.0 = b 그대로"""
+        p = min(1.0, max(0.0, float(progress)))
+        h, w = self.out.shape[:2]
+        if self.kind == "wipe":
+            x = int(round(p * w))
+            self.out[:, : w - x] = a[:, : w - x]
+            self.out[:, w - x :] = b[:, :x]
+            return self.out
+
+        wb = int(round(p * 256))
+        np.multiply(a.reshape(h, w * 3), 256 - wb, out=self._acc, dtype=np.uint16)
+        np.multiply(b.reshape(h, w * 3), wb, out=self._tmp, dtype=np.uint16)
+        self._acc += self._tmp
+        self._acc += 128
+        self._acc >>= 8
+        np.copyto(self.out.reshape(h, w * 3), self._acc, casting="unsafe")
+        return self.out
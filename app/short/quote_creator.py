@@ -9,16 +9,87 @@ import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 from moviepy.editor import ImageClip, concatenate_videoclips
 
+from app.render.engine import render_timeline
+from app.render.fonts import get_font
+from app.render.metrics import RenderMetrics, moviepy_frame_count
+from app.render.profile import get_profile
+from app.render.text_draw import draw_outlined_text
+from app.render.text_metrics import get_measure
+from app.render.timeline import Slide, Timeline
 from config import settings
 
 
-def _load_font(path: str | None, size: int):
-    if path:
-        try:
-            return ImageFont.truetype(path, size)
-        except Exception:
-            return ImageFont.load_default()
-    return ImageFont.load_default()
+class _TypingCanvas:
+    """
+    타이핑 프레임 증분 렌더러.
+    - 배경 + 제목 + '완성된 줄'은 base 이미지에 한 번만 그려 둔다
+    - 토큰이 추가될 때는 base 복사본에 현재 줄만 다시 그린다
+      (줄이 가운데 정렬이라 토큰이 늘면 줄 전체의 x 위치가 바뀌므로 줄 단위로 그린다)
+    줄은 위에서부터 순서대로 확정되므로 그리는 순서가 전체 재렌더와 같고, 결과도 픽셀 단위로 같다.
+    """
+
+    def __init__(
+        self,
+        *,
+        title: str,
+        line_count: int,
+        resolution: tuple[int, int],
+        title_font: ImageFont.ImageFont,
+        body_font: ImageFont.ImageFont,
+    ):
+        w, h = resolution
+        self.width = w
+        self.body_font = body_font
+        self.measure = get_measure(body_font)
+        self.outline_width = int(getattr(settings, "SHORT_TEXT_OUTLINE_WIDTH", 3))
+        self.base = Image.new("RGB", (w, h), (0, 0, 0))
+        draw = ImageDraw.Draw(self.base)
+
+        # title (top)
+        pad_x = int(w * 0.06)
+        top_y = int(h * 0.06)
+        draw.text((pad_x, top_y), title, font=title_font, fill=(255, 255, 255))
+
+        # body (center)
+        safe_top = int(h * 0.18)
+        safe_bottom = int(h * 0.18)
+
+        # line heights
+        ascent, descent = body_font.getmetrics()
+        line_h = ascent + descent + 20
+        block_h = line_h * line_count
+        y = safe_top + max(0, ((h - safe_top - safe_bottom) - block_h) // 2)
+        self.line_ys = [y + i * line_h for i in range(line_count)]
+
+    def _draw_line(self, img: Image.Image, index: int, line: str) -> None:
+        if not line:
+            return
+        draw = ImageDraw.Draw(img)
+        y = self.line_ys[index]
+        # 가운데 정렬
+        tw = self.measure.width(line)
+        x = (self.width - tw) // 2
+
+        # 흰 글자 + 검은 외곽선
+        draw_outlined_text(
+            draw,
+            (x, y),
+            line,
+            self.body_font,
+            outline_width=self.outline_width,
+            fill=(255, 255, 255),
+            outline_fill=(0, 0, 0),
+        )
+
+    def render(self, index: int, line: str) -> np.ndarray:
+        """확정된 줄 + index 줄(진행 중)을 그린 프레임"""
+        img = self.base.copy()
+        self._draw_line(img, index, line)
+        return np.array(img)
+
+    def commit(self, index: int, line: str) -> None:
+        """index 줄을 완성된 줄로 base에 고정한다."""
+        self._draw_line(self.base, index, line)
 
 
 def _render_frame(
@@ -29,38 +100,16 @@ def _render_frame(
     title_font: ImageFont.ImageFont,
     body_font: ImageFont.ImageFont,
 ) -> np.ndarray:
-    w, h = resolution
-    img = Image.new("RGB", (w, h), (0, 0, 0))
-    draw = ImageDraw.Draw(img)
-
-    # title (top)
-    pad_x = int(w * 0.06)
-    top_y = int(h * 0.06)
-    draw.text((pad_x, top_y), title, font=title_font, fill=(255, 255, 255))
-
-    # body (center)
-    safe_top = int(h * 0.18)
-    safe_bottom = int(h * 0.18)
-    max_width = int(w * 0.88)
-
-    # line heights
-    ascent, descent = body_font.getmetrics()
-    line_h = ascent + descent + 20
-    block_h = line_h * len(lines)
-    y = safe_top + max(0, ((h - safe_top - safe_bottom) - block_h) // 2)
-
-    for line in lines:
-        # 가운데 정렬
-        tw = draw.textlength(line, font=body_font)
-        x = (w - tw) // 2
-
-        # outline
-        for ox, oy in [(-3,0),(3,0),(0,-3),(0,3),(-3,-3),(3,3),(-3,3),(3,-3)]:
-            draw.text((x+ox, y+oy), line, font=body_font, fill=(0, 0, 0))
-        draw.text((x, y), line, font=body_font, fill=(255, 255, 255))
-        y += line_h
-
-    return np.array(img)
+    canvas = _TypingCanvas(
+        title=title,
+        line_count=len(lines),
+        resolution=resolution,
+        title_font=title_font,
+        body_font=body_font,
+    )
+    for i, line in enumerate(lines):
+        canvas.commit(i, line)
+    return np.array(canvas.base)
 
 
 def create_quote_short(
@@ -71,12 +120,17 @@ def create_quote_short(
     output_path: str,
     token_interval_sec: float,
     hold_sec: float,
+    profile: str | None = None,
+    run_dir: str | Path | None = None,
 ) -> str:
+    """run_dir가 있으면 단계별 시간/카운트를 run_dir/render_metrics.json의 "quote_short"에 남긴다"""
     logger = logging.getLogger("auto_youtube.quote_video")
+    metrics = RenderMetrics("quote_short")
     out = Path(output_path)
     out.parent.mkdir(parents=True, exist_ok=True)
 
-    w, h = settings.SHORT_VIDEO_RESOLUTION
+    prof = get_profile(profile)
+    w, h = prof.resolution(settings.SHORT_VIDEO_RESOLUTION)
     duration = float(settings.SHORT_DURATION_SEC)
 
     # 토큰 총 개수
@@ -98,21 +152,21 @@ def create_quote_short(
     interval = max(0.06, interval)
 
     logger.info(
-        "render start out=%s duration=%.2fs tokens=%s interval=%.3fs hold=%.2fs",
+        "render start out=%s duration=%.2fs tokens=%s interval=%.3fs hold=%.2fs profile=%s",
         out,
         duration,
         total_tokens,
         interval,
         hold_sec,
+        prof.name,
     )
 
     font_path = str(settings.FONT_PATH) if hasattr(settings, "FONT_PATH") else None
-    title_font = _load_font(font_path, 44)
-    body_font = _load_font(font_path, 86)
+    title_font = get_font(font_path, prof.font_size(44))
+    body_font = get_font(font_path, prof.font_size(86))
 
     # 타이핑 진행 상태
     current: list[list[str]] = [[] for _ in typing_units]
-    clips: list[ImageClip] = []
 
     def make_display_lines() -> list[str]:
         lines = []
@@ -121,36 +175,70 @@ def create_quote_short(
         # 빈 줄도 표시되긴 해서, 최소한 공백 유지
         return [ln if ln else "" for ln in lines]
 
-    # 토큰이 1개씩 추가되는 단계별 프레임 생성
-    for i, row in enumerate(typing_units):
-        for tok in row:
-            current[i].append(tok)
-            frame = _render_frame(
-                title=video_title,
-                lines=make_display_lines(),
-                resolution=(w, h),
-                title_font=title_font,
-                body_font=body_font,
-            )
-            clips.append(ImageClip(frame).set_duration(interval))
+    # 화면은 토큰 경계에서만 바뀌므로 (프레임, 표시 시간) 이벤트 목록만 만든다
+    events: list[tuple[np.ndarray, float]] = []
+    last_lines: list[str] | None = None
 
-    # 마지막 hold
-    final_frame = _render_frame(
+    canvas = _TypingCanvas(
         title=video_title,
-        lines=[" ".join(row).strip() for row in typing_units],
+        line_count=len(typing_units),
         resolution=(w, h),
         title_font=title_font,
         body_font=body_font,
     )
-    clips.append(ImageClip(final_frame).set_duration(hold_sec))
-
-    video = concatenate_videoclips(clips, method="compose").subclip(0, duration)
-    video.write_videofile(
-        str(out),
-        fps=settings.VIDEO_FPS,
-        codec="libx264",
-        audio=False,
-    )
-    return str(out)
 
+    with metrics.phase("typing_frames"):
+        # 토큰이 1개씩 추가되는 단계별 프레임 생성 (진행 중인 줄만 다시 그림)
+        for i, row in enumerate(typing_units):
+            for tok in row:
+                current[i].append(tok)
+                last_lines = make_display_lines()
+                events.append((canvas.render(i, last_lines[i]), interval))
+            canvas.commit(i, make_display_lines()[i])
+
+        # 마지막 hold (마지막 토큰 화면과 같으면 다시 그리지 않고 이벤트만 연장)
+        final_lines = [" ".join(row).strip() for row in typing_units]
+        if events and last_lines == final_lines:
+            frame, d = events[-1]
+            events[-1] = (frame, d + hold_sec)
+        else:
+            final_frame = _render_frame(
+                title=video_title,
+                lines=final_lines,
+                resolution=(w, h),
+                title_font=title_font,
+                body_font=body_font,
+            )
+            events.append((final_frame, hold_sec))
+    # 타이핑 화면은 이벤트마다 한 장씩 그린 텍스트 프레임 (이미지 디코드 없음)
+    metrics.add("overlays", len(events))
+    metrics.add("overlays_rendered", len(events))
+
+    # moviepy subclip(0, duration)과 같게: 이벤트가 duration보다 짧으면 나머지는 검은 화면
+    total = sum(d for _, d in events)
+    if total < duration:
+        events.append((np.zeros((h, w, 3), dtype=np.uint8), duration - total))
+    logger.info("typing events=%s total=%.2fs", len(events), sum(d for _, d in events))
+
+    # 화면이 토큰 경계에서만 바뀌므로 전역 RENDER_ENGINE과 무관하게 이벤트 단위 인코딩(segments)이 기본
+    # (moviepy는 길이 x fps 프레임을 전부 합성/인코딩한다 - QUOTE_RENDER_ENGINE="moviepy"로만 선택)
+    engine = str(getattr(settings, "QUOTE_RENDER_ENGINE", "segments"))
+    with metrics.phase("render"):
+        if engine != "moviepy":
+            timeline = Timeline(size=(w, h), slides=[Slide(f, d) for f, d in events], duration=duration)
+            render_timeline(timeline, str(out), fps=prof.video_fps, engine=engine, profile=prof, metrics=metrics)
+        else:
+            clips = [ImageClip(f).set_duration(d) for f, d in events]
+            video = concatenate_videoclips(clips, method="compose").subclip(0, duration)
+            video.write_videofile(
+                str(out),
+                codec="libx264",
+                audio=False,
+                **prof.moviepy_kwargs(),
+            )
+            n = moviepy_frame_count(duration, prof.video_fps)
+            metrics.add("frames_composited", n)
+            metrics.add("frames_encoded", n)
 
+    metrics.finish(out, run_dir)
+    return str(out)
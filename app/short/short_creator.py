@@ -1,13 +1,24 @@
-import requests
 import numpy as np
-from io import BytesIO
 import logging
-from pathlib import Path
 import re
+from functools import partial
+from pathlib import Path
 
 from PIL import Image, ImageDraw, ImageFont
-from moviepy.editor import ImageClip, CompositeVideoClip
-
+from moviepy.editor import CompositeVideoClip
+
+from app.render.engine import render_timeline
+from app.render.fonts import get_font
+from app.render.metrics import RenderMetrics, moviepy_frame_count
+from app.render.profile import get_profile
+from app.render.slides import get_slide_pool
+from app.render.text_draw import draw_outlined_text, outline_padding
+from app.render.text_metrics import get_measure
+from app.render.kenburns import configured_zoom, ken_burns_for, source_size
+from app.render.moviepy_clips import overlay_clip, slideshow_clip
+from app.render.overlay_cache import cached_overlay, log_overlay_cache_stats, overlay_cache_stats, stats_delta
+from app.render.timeline import LazyOverlay, OverlayLRU, Slide, Timeline
+from app.render.transitions import configured_transition
 from config import settings
 
 
@@ -23,47 +34,28 @@ def make_center_text_image(
     draw = ImageDraw.Draw(img)
 
     # 폰트 로드 (한글이면 ttf 필수)
-    if font_path:
-        try:
-            font = ImageFont.truetype(font_path, font_size)
-        except Exception:
-            font = ImageFont.load_default()
-    else:
-        font = ImageFont.load_default()
+    font = get_font(font_path, font_size)
 
     # 간단 래핑
     max_width = int(w * 0.85)
+    measure = get_measure(font)
     lines = []
     for raw_line in text.split("\n"):
-        words = raw_line.split(" ")
-        cur = ""
-        for word in words:
-            test = (cur + " " + word).strip()
-            tw = draw.textlength(test, font=font)
-            if tw <= max_width:
-                cur = test
-            else:
-                if cur:
-                    lines.append(cur)
-                cur = word
-        if cur:
-            lines.append(cur)
+        lines.extend(measure.wrap_words(raw_line, max_width))
 
     # 전체 높이 계산
     ascent, descent = font.getmetrics()
     line_h = ascent + descent + 12
     block_h = line_h * len(lines)
 
+    outline_width = int(getattr(settings, "SHORT_TEXT_OUTLINE_WIDTH", 3))
     y = (h - block_h) // 2
     for line in lines:
-        tw = draw.textlength(line, font=font)
+        tw = measure.width(line)
         x = (w - tw) // 2
 
-        # outline
-        for ox, oy in [(-3,0),(3,0),(0,-3),(0,3),(-3,-3),(3,3),(-3,3),(3,-3)]:
-            draw.text((x+ox, y+oy), line, font=font, fill=(0, 0, 0, 255))
-        # main
-        draw.text((x, y), line, font=font, fill=(255, 255, 255, 255))
+        # 흰 글자 + 검은 외곽선
+        draw_outlined_text(draw, (x, y), line, font, outline_width=outline_width)
 
         y += line_h
 
@@ -80,7 +72,10 @@ def wrap_text_by_width(
     공백이 거의 없는 한글도 깨지지 않게 '폭 기준'으로 래핑.
     - 공백 기준으로 먼저 시도
     - 한 단어(토큰)가 너무 길면 문자 단위로 하드 래핑
+    - 폭은 TextMeasure(글자 advance + 쌍 커닝 캐시)로 재서 draw.textlength를 매번 부르지 않는다
+      (draw는 호출부 호환용으로 남겨 둔 인자)
     """
+    measure = get_measure(font)
     text = (text or "").strip()
     if not text:
         return []
@@ -93,45 +88,117 @@ def wrap_text_by_width(
 
         tokens = raw_line.split(" ")
         cur = ""
+        cur_w = 0.0
 
         def flush():
-            nonlocal cur
+            nonlocal cur, cur_w
             if cur:
                 lines.append(cur)
                 cur = ""
+                cur_w = 0.0
 
         for tok in tokens:
             if not tok:
                 continue
 
             # 토큰 자체가 너무 길면(공백 없는 한글 등) 문자 단위로 자른다
-            if draw.textlength(tok, font=font) > max_width:
+            tok_w = measure.width(tok)
+            if tok_w > max_width:
                 flush()
-                buf = ""
-                for ch in tok:
-                    test = buf + ch
-                    if draw.textlength(test, font=font) <= max_width:
-                        buf = test
-                    else:
-                        if buf:
-                            lines.append(buf)
-                        buf = ch
-                if buf:
-                    lines.append(buf)
+                lines.extend(measure.hard_wrap(tok, max_width))
                 continue
 
-            test = (cur + " " + tok).strip() if cur else tok
-            if draw.textlength(test, font=font) <= max_width:
-                cur = test
+            if cur:
+                test = (cur + " " + tok).strip()
+                if test.startswith(cur):
+                    tw = measure.extend(cur_w, cur[-1], test[len(cur):])
+                else:
+                    tw = measure.width(test)
+            else:
+                test, tw = tok, tok_w
+            if tw <= max_width:
+                cur, cur_w = test, tw
             else:
                 flush()
-                cur = tok
+                cur, cur_w = tok, tok_w
 
         flush()
 
     return lines
 
 
+def fit_font_size(
+    draw: ImageDraw.ImageDraw,
+    text: str,
+    font_path: str | None,
+    font_size: int,
+    *,
+    max_width: int,
+    max_lines: int,
+    max_block_h: int,
+    min_font: int = 18,
+    step: int = 2,
+    max_steps: int = 60,
+) -> tuple[ImageFont.ImageFont, list[str]]:
+    """
+    font_size에서 step씩 줄여 가며 처음 맞는 크기를 찾던 선형 탐색과 같은 크기를 이분 탐색으로 찾는다.
+    - 후보: font_size, font_size-step, ... (min_font 이하가 되는 첫 크기까지, 최대 max_steps개)
+    - '맞는다' = max_lines 이하 줄 수 + 블록 높이 <= max_block_h + 가장 긴 줄 <= max_width
+      폰트가 작아질수록 이 조건은 유지된다(단조)고 보고, 맞는 후보 중 가장 큰 크기를 고른다
+    - 후보별 래핑/측정 결과는 memo에 두고 최종 결과에 그대로 재사용
+    - 아무 후보도 안 맞으면 선형 탐색처럼 마지막 크기의 래핑 결과를 돌려준다
+    반환: (font, lines)
+    """
+    sizes: list[int] = []
+    size = font_size
+    for _ in range(max_steps):
+        sizes.append(size)
+        if size <= min_font:
+            break
+        size -= step
+
+    memo: dict[int, tuple[ImageFont.ImageFont, list[str], bool]] = {}
+
+    def probe(i: int) -> tuple[ImageFont.ImageFont, list[str], bool]:
+        if i not in memo:
+            font = get_font(font_path, sizes[i])
+            # 래핑(공백 없는 한글 포함)
+            lines = wrap_text_by_width(draw, text, font, max_width)
+            ascent, descent = font.getmetrics()
+            line_h = ascent + descent + 12
+            # max_lines 제한 내에서 전체 문장이 다 들어가는지 확인
+            block_h = line_h * min(len(lines), max_lines if max_lines > 0 else len(lines))
+            # 가로도 체크(혹시 폰트 로딩 실패 등으로 폭 계산이 이상할 때 대비)
+            widest = max((get_measure(font).width(line) for line in lines), default=0.0)
+            fits = (len(lines) <= max_lines) and (block_h <= max_block_h) and (widest <= max_width)
+            memo[i] = (font, lines, fits)
+        return memo[i]
+
+    # 짧은 자막은 대부분 시작 크기에서 바로 맞는다
+    if probe(0)[2]:
+        font, lines, _ = probe(0)
+        return font, lines
+
+    last = len(sizes) - 1
+    if not probe(last)[2]:
+        if sizes[last] <= min_font:
+            font, lines, _ = probe(last)
+            return font, lines
+        # 선형 탐색이 max_steps를 다 쓰고 멈춘 경우: 한 단계 더 줄인 크기로 끝난다
+        font = get_font(font_path, sizes[last] - step)
+        return font, wrap_text_by_width(draw, text, font, max_width)
+
+    lo, hi = 0, last
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if probe(mid)[2]:
+            hi = mid
+        else:
+            lo = mid + 1
+    font, lines, _ = probe(lo)
+    return font, lines
+
+
 def make_bottom_subtitle_image(
     text: str,
     canvas_size: tuple[int, int],
@@ -140,25 +207,17 @@ def make_bottom_subtitle_image(
     box_height_ratio: float = 0.28,
     max_lines: int = 3,
     bg_alpha: int = 170,
-) -> np.ndarray:
+) -> tuple[np.ndarray, tuple[int, int]]:
     """
     숏츠용: 하단 박스 자막(전체 화면 덮임 방지)
+    - 반환: (박스 영역만 담은 RGBA, 캔버스 기준 배치 위치 (x, y))
     """
     w, h = canvas_size
-    img = Image.new("RGBA", (w, h), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
+    draw = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
 
     margin = int(w * 0.07)
     max_width = w - margin * 2
 
-    def load_font(size: int):
-        if font_path:
-            try:
-                return ImageFont.truetype(font_path, size)
-            except Exception:
-                return ImageFont.load_default()
-        return ImageFont.load_default()
-
     # 유튜브 숏츠 플레이어 컨트롤/하단 UI에 가려지는 걸 피하려고
     # 자막 박스를 바닥에 붙이지 않고 약간 위로 올린다.
     safe_bottom_ratio = float(getattr(settings, "SHORT_SUBTITLE_SAFE_BOTTOM_RATIO", 0.06))
@@ -175,40 +234,20 @@ def make_bottom_subtitle_image(
 
     # 텍스트가 박스 안에 "절대" 안 잘리도록 폰트 사이즈 자동 축소
     # 우선 목표: 'ellipsis 없이' max_lines 안에 전체 문장을 넣기
-    font = load_font(font_size)
     # 너무 일찍 폰트 축소를 멈추면 불필요하게 "…"이 생김.
     # 숏츠는 화면이 크므로 충분히 줄일 수 있게 하한을 낮춘다.
-    min_font = 18
-    fitted_lines: list[str] = []
-
-    for _ in range(60):
-        # 래핑(공백 없는 한글 포함)
-        lines = wrap_text_by_width(draw, text or "", font, max_width)
-
-        ascent, descent = font.getmetrics()
-        line_h = ascent + descent + 12
-        # max_lines 제한 내에서 전체 문장이 다 들어가는지 확인
-        block_h = line_h * min(len(lines), max_lines if max_lines > 0 else len(lines))
-
-        # 가로도 체크(혹시 폰트 로딩 실패 등으로 폭 계산이 이상할 때 대비)
-        widest = 0.0
-        for line in lines:
-            widest = max(widest, draw.textlength(line, font=font))
-
-        # ellipsis 없이 max_lines 내로 들어가는 경우
-        if (len(lines) <= max_lines) and (block_h <= (box_h - pad_y * 2)) and (widest <= (max_width)):
-            fitted_lines = lines
-            break
-
-        # 더 줄일 수 없으면 중단
-        if font_size <= min_font:
-            fitted_lines = lines
-            break
-        font_size -= 2
-        font = load_font(font_size)
+    font, lines = fit_font_size(
+        draw,
+        text or "",
+        font_path,
+        font_size,
+        max_width=max_width,
+        max_lines=max_lines,
+        max_block_h=box_h - pad_y * 2,
+        min_font=18,
+    )
 
     # 아직도 라인이 많다면(=max_lines를 넘는다면) 이때만 ellipsis 처리
-    lines = fitted_lines if fitted_lines else wrap_text_by_width(draw, text or "", font, max_width)
     if max_lines and len(lines) > max_lines:
         kept = lines[:max_lines]
         # 마지막 줄을 말줄임으로 마무리(단어 중간도 허용)
@@ -216,23 +255,30 @@ def make_bottom_subtitle_image(
         kept[-1] = (last[:-1] if len(last) > 1 else last) + "…"
         lines = kept
 
-    bg = Image.new("RGBA", (w, box_h), (0, 0, 0, bg_alpha))
-    img.paste(bg, (0, box_top))
-
     ascent, descent = font.getmetrics()
     line_h = ascent + descent + 12
     block_h = line_h * len(lines)
     y = box_top + max(pad_y, (box_h - block_h) // 2)
 
+    # 박스 + 글자(외곽선 포함)가 닿을 수 있는 세로 범위만 이미지로 만든다
+    outline_width = int(getattr(settings, "SHORT_TEXT_OUTLINE_WIDTH", 3))
+    pad = outline_padding(outline_width)
+    top = max(0, min(box_top, y - pad))
+    bottom = min(h, max(box_bottom, y + block_h + pad))
+    img = Image.new("RGBA", (w, bottom - top), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    bg = Image.new("RGBA", (w, box_h), (0, 0, 0, bg_alpha))
+    img.paste(bg, (0, box_top - top))
+    y -= top
+
+    measure = get_measure(font)
     for line in lines:
-        tw = draw.textlength(line, font=font)
+        tw = measure.width(line)
         x = (w - tw) // 2
-        for ox, oy in [(-3,0),(3,0),(0,-3),(0,3),(-3,-3),(3,3),(-3,3),(3,-3)]:
-            draw.text((x+ox, y+oy), line, font=font, fill=(0, 0, 0, 255))
-        draw.text((x, y), line, font=font, fill=(255, 255, 255, 255))
+        draw_outlined_text(draw, (x, y), line, font, outline_width=outline_width)
         y += line_h
 
-    return np.array(img)
+    return np.array(img), (0, top)
 
 def split_short_segments(text: str) -> list[str]:
     """
@@ -300,10 +346,21 @@ def split_long_segment(seg: str, max_len: int = 45) -> list[str]:
     return [x for x in final if x]
 
 
-def create_short_video(text: str, image_url: str | list[str], output: str | None = None):
+def create_short_video(
+    text: str,
+    image_url: str | list[str],
+    output: str | None = None,
+    profile: str | None = None,
+    run_dir: str | Path | None = None,
+):
+    """run_dir가 있으면 단계별 시간/카운트를 run_dir/render_metrics.json의 "short_video"에 남긴다"""
     logger = logging.getLogger("auto_youtube.video.short")
     if output is None:
         output = str(settings.SHORT_VIDEO_PATH)
+    metrics = RenderMetrics("short_video")
+
+    prof = get_profile(profile)
+    resolution = prof.resolution(settings.SHORT_VIDEO_RESOLUTION)
 
     # image_url: str 또는 list[str] 허용 (여러 이미지 전환)
     sources = image_url if isinstance(image_url, list) else [image_url]
@@ -316,31 +373,36 @@ def create_short_video(text: str, image_url: str | list[str], output: str | None
     if slide <= 0:
         slide = 2
 
-    logger.info("start output=%s duration=%ss slide=%ss images=%s", output, duration, slide, len(sources))
+    logger.info(
+        "start output=%s duration=%ss slide=%ss images=%s profile=%s resolution=%s",
+        output,
+        duration,
+        slide,
+        len(sources),
+        prof.name,
+        resolution,
+    )
 
     n = max(1, int(np.ceil(duration / slide)))
     cycle = [sources[i % len(sources)] for i in range(n)]
 
-    clips = []
-    for idx, src in enumerate(cycle):
-        try:
-            p = Path(str(src))
-            if p.exists():
-                img = Image.open(str(p)).convert("RGB")
-            else:
-                r = requests.get(src, timeout=15, headers={"User-Agent": "auto-youtube/1.0"})
-                r.raise_for_status()
-                img = Image.open(BytesIO(r.content)).convert("RGB")
-            img = img.resize(settings.SHORT_VIDEO_RESOLUTION)
-            clips.append(ImageClip(np.array(img)).set_duration(slide))
-        except Exception as e:
-            logger.exception("short_image_fail idx=%s src=%s err=%s", idx, src, e)
-
-    if not clips:
-        raise RuntimeError("No valid images for short video")
+    # 롱폼과 같은 프로세스 전역 이미지 풀 (같은 원본이면 디코드 없이 리샘플만)
+    pool = get_slide_pool()
+    zoom = configured_zoom()
+    load_size = source_size(resolution, zoom) if zoom else resolution
+    frames: list[np.ndarray] = []
+    pool_before = pool.stats()
+    with metrics.phase("load_images"):
+        for idx, src in enumerate(cycle):
+            try:
+                frames.append(pool.load(src, load_size))
+            except Exception as e:
+                logger.exception("short_image_fail idx=%s src=%s err=%s", idx, src, e)
+    metrics.record_images(len(cycle), len(frames), stats_delta(pool.stats(), pool_before))
+    logger.info("slide_pool %s", pool.stats())
 
-    from moviepy.editor import concatenate_videoclips
-    slideshow = concatenate_videoclips(clips, method="compose").subclip(0, duration)
+    if not frames:
+        raise RuntimeError("No valid images for short video")
 
     # 자막도 세그먼트로 분리해서 시간에 따라 교체 (롱폼과 동일한 UX)
     segments = split_short_segments(text)
@@ -359,25 +421,67 @@ def create_short_video(text: str, image_url: str | list[str], output: str | None
     seg_duration = duration / len(segments)
     logger.info("subtitle_segments=%s seg_duration=%.2fs", len(segments), seg_duration)
 
-    subtitle_clips = []
-    for i, seg in enumerate(segments):
-        start = i * seg_duration
-        subtitle_np = make_bottom_subtitle_image(
-            text=seg,
-            canvas_size=settings.SHORT_VIDEO_RESOLUTION,
-            font_path=str(settings.FONT_PATH) if hasattr(settings, "FONT_PATH") else None,
-            font_size=settings.SHORT_FONT_SIZE,
-            max_lines=int(getattr(settings, "SHORT_SUBTITLE_MAX_LINES", 3)),
-            box_height_ratio=float(getattr(settings, "SHORT_SUBTITLE_BOX_HEIGHT_RATIO", 0.32)),
+    # 자막 이미지는 타임라인이 해당 구간에 도달했을 때 렌더 (작은 LRU에만 보관)
+    # 렌더 결과는 디스크 캐시(overlay_cache)에도 남겨 다음 실행에서 같은 자막을 재사용
+    overlay_before = overlay_cache_stats()
+    subtitle_lru = OverlayLRU(int(getattr(settings, "SUBTITLE_LRU_SIZE", 2)))
+    subtitles = [
+        LazyOverlay(
+            partial(
+                cached_overlay,
+                make_bottom_subtitle_image,
+                settings_keys=(
+                    "SHORT_SUBTITLE_SAFE_BOTTOM_RATIO",
+                    "SHORT_SUBTITLE_BOX_HEIGHT_RATIO",
+                    "SHORT_SUBTITLE_MAX_LINES",
+                    "SHORT_TEXT_OUTLINE_WIDTH",
+                ),
+                text=seg,
+                canvas_size=resolution,
+                font_path=str(settings.FONT_PATH) if hasattr(settings, "FONT_PATH") else None,
+                font_size=prof.font_size(settings.SHORT_FONT_SIZE),
+                max_lines=int(getattr(settings, "SHORT_SUBTITLE_MAX_LINES", 3)),
+                box_height_ratio=float(getattr(settings, "SHORT_SUBTITLE_BOX_HEIGHT_RATIO", 0.32)),
+            ),
+            i * seg_duration,
+            seg_duration,
+            subtitle_lru,
         )
-        subtitle_clips.append(ImageClip(subtitle_np).set_start(start).set_duration(seg_duration))
-
-    final = CompositeVideoClip([slideshow, *subtitle_clips])
-    final.write_videofile(
-        output,
-        fps=settings.VIDEO_FPS,
-        codec="libx264",
-        audio=False
-    )
-
-    return output
\ No newline at end of file
+        for i, seg in enumerate(segments)
+    ]
+
+    slides = [Slide(f, slide, motion=ken_burns_for(i, zoom) if zoom else None) for i, f in enumerate(frames)]
+    transition = configured_transition()
+
+    engine = str(getattr(settings, "RENDER_ENGINE", "moviepy"))
+    logger.info("render engine=%s", engine)
+
+    with metrics.phase("render"):
+        if engine != "moviepy":
+            timeline = Timeline(
+                size=resolution,
+                slides=slides,
+                overlays=subtitles,
+                duration=duration,
+                transition=transition,
+            )
+            render_timeline(timeline, output, fps=prof.video_fps, engine=engine, profile=prof, metrics=metrics)
+        else:
+            slideshow = slideshow_clip(slides, resolution, transition).subclip(0, duration)
+            subtitle_clips = [overlay_clip(o, resolution) for o in subtitles]
+
+            final = CompositeVideoClip([slideshow, *subtitle_clips])
+            final.write_videofile(
+                output,
+                codec="libx264",
+                audio=False,
+                **prof.moviepy_kwargs(),
+            )
+            n = moviepy_frame_count(final.duration, prof.video_fps)
+            metrics.add("frames_composited", n)
+            metrics.add("frames_encoded", n)
+
+    log_overlay_cache_stats(logger, overlay_before)
+    metrics.record_overlays(len(subtitles), stats_delta(overlay_cache_stats(), overlay_before))
+    metrics.finish(output, run_dir)
+    return output
@@ -2,10 +2,19 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Sequence
 
 import requests
+from requests.adapters import HTTPAdapter
+
+USER_AGENT = "auto-youtube/1.0"
+
+_session: requests.Session | None = None
+_session_pool_size = 0
+_session_lock = threading.Lock()
 
 
 def save_text(path: Path, text: str) -> None:
@@ -18,17 +27,80 @@ def save_json(path: Path, obj: Any) -> None:
     path.write_text(json.dumps(obj, ensure_ascii=False, indent=2), encoding="utf-8")
 
 
-def download_image_to(path: Path, url: str, timeout: int = 15) -> bool:
+def http_session(pool_size: int | None = None) -> requests.Session:
+    """
+    이미지 다운로드용 공유 세션 (호스트별 keep-alive 커넥션 재사용).
+    - 같은 CDN에서 여러 장을 받을 때 매번 TCP/TLS 핸드셰이크를 하지 않는다
+    - pool_size: 호스트당 유지할 커넥션 수 (기본: settings.IMAGE_DOWNLOAD_WORKERS)
+      동시 다운로드 워커 수보다 작으면 반납된 커넥션이 버려지므로, 더 큰 요청이 오면 풀을 키워 다시 마운트한다
+    """
+    global _session, _session_pool_size
+    if pool_size is None:
+        # settings(config_loader)는 API 키 검사를 하므로 모듈 import 시점이 아니라 필요할 때 읽는다
+        # (벤치마크 등 오프라인 도구가 save_json만 쓰려고 이 모듈을 import한다)
+        from config import settings
+
+        pool_size = int(getattr(settings, "IMAGE_DOWNLOAD_WORKERS", 12))
+    pool_size = max(1, int(pool_size))
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            _session.headers.update({"User-Agent": USER_AGENT})
+        if pool_size > _session_pool_size:
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            _session.mount("http://", adapter)
+            _session.mount("https://", adapter)
+            _session_pool_size = pool_size
+        return _session
+
+
+def fetch_image_bytes(url: str, timeout: int = 15, session: requests.Session | None = None) -> tuple[bytes, bool]:
+    """
+    url 이미지 바이트. 공유 이미지 저장소(image_cache)에 있으면 다운로드하지 않는다.
+    반환: (바이트, 실제로 다운로드했는지)
+    """
+    from app.utils.image_cache import get_image_store
+
+    store = get_image_store()
+    cached = store.get(url) if store is not None else None
+    if cached is not None:
+        try:
+            return cached.read_bytes(), False
+        except OSError:
+            pass
+    r = (session or http_session()).get(url, timeout=timeout)
+    r.raise_for_status()
+    if store is not None:
+        store.put(url, r.content)
+    return r.content, True
+
+
+def download_image_to(path: Path, url: str, timeout: int = 15, session: requests.Session | None = None) -> bool:
     """
     url 이미지를 다운로드해서 path에 저장. 성공하면 True.
+    - 공유 이미지 저장소(image_cache)에 있으면 다운로드 없이 하드링크
+    - session: 생략하면 공유 세션(http_session) 사용
     """
+    from app.utils.image_cache import get_image_store
+
     logger = logging.getLogger("auto_youtube.artifacts")
     path.parent.mkdir(parents=True, exist_ok=True)
 
+    store = get_image_store()
     try:
-        r = requests.get(url, timeout=timeout, headers={"User-Agent": "auto-youtube/1.0"})
+        cached = store.get(url) if store is not None else None
+        if cached is not None:
+            store.link_to(cached, path)
+            logger.debug("image_cached url=%s path=%s", url, path)
+            return True
+
+        r = (session or http_session()).get(url, timeout=timeout)
         r.raise_for_status()
-        path.write_bytes(r.content)
+        obj = store.put(url, r.content) if store is not None else None
+        if obj is not None:
+            store.link_to(obj, path)
+        else:
+            path.write_bytes(r.content)
         logger.debug("image_saved url=%s path=%s bytes=%s", url, path, len(r.content))
         return True
     except Exception as e:
@@ -36,3 +108,30 @@ def download_image_to(path: Path, url: str, timeout: int = 15) -> bool:
         return False
 
 
+def download_images(jobs: Sequence[tuple[Path, str]], workers: int | None = None, timeout: int = 15) -> list[bool]:
+    """
+    (저장 경로, url) 목록을 최대 workers개 스레드로 동시에 다운로드한다 (기본: settings.IMAGE_DOWNLOAD_WORKERS).
+    - 반환: jobs와 같은 순서의 성공 여부 (실패한 항목이 있어도 나머지는 계속 받는다)
+    - 전체 시간은 대략 가장 느린 한 장 수준 (workers >= len(jobs)일 때)
+    """
+    if not jobs:
+        return []
+    if workers is None:
+        from config import settings
+
+        workers = int(getattr(settings, "IMAGE_DOWNLOAD_WORKERS", 12))
+    workers = max(1, min(int(workers), len(jobs)))
+    session = http_session(workers)
+    if workers == 1:
+        results = [download_image_to(path, url, timeout, session) for path, url in jobs]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="image-dl") as pool:
+            results = list(pool.map(lambda job: download_image_to(job[0], job[1], timeout, session), jobs))
+
+    from app.utils.image_cache import get_image_store
+
+    # 이미지 저장소 인덱스는 장마다가 아니라 한 번에 쓴다
+    store = get_image_store()
+    if store is not None:
+        store.flush()
+    return results
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from config import settings
+
+INDEX_FILENAME = "index.json"
+
+
+class ImageStore:
+    """
+    실행 간 공유되는 content-addressed 이미지 저장소 (OUTPUT_DIR/image_cache).
+    - objects/<sha256(내용)>: 원본 바이트 그대로 (다른 URL이 같은 사진이면 한 벌만 저장)
+    - index.json: URL -> 내용 해시 (여러 프로세스가 써도 다시 읽어서 합친 뒤 os.replace로 교체)
+      put()은 메모리 인덱스만 바꾸고, 파일은 flush()에서 한 번에 쓴다 (download_images 끝 / 프로세스 종료 시)
+    - 총 용량이 max_bytes를 넘으면 가장 오래 안 쓴(mtime) 객체부터 지운다 (hit 시 mtime 갱신)
+    - 실행별 images_dir에는 복사 대신 하드링크 (다른 파일시스템이면 복사)
+      → 캐시에서 지워져도 이미 링크된 실행 결과물은 남는다
+    """
+
+    def __init__(self, root: Path, max_bytes: int):
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.index_path = self.root / INDEX_FILENAME
+        self.max_bytes = max(0, int(max_bytes))
+        self.counters = {"hits": 0, "misses": 0, "writes": 0, "evicted": 0, "linked": 0, "copied": 0}
+        self._lock = threading.Lock()
+        self._urls: dict[str, str] | None = None  # url -> digest
+        self._objects: OrderedDict[str, int] | None = None  # digest -> bytes (오래된 순)
+        self._dirty = False  # flush 안 된 인덱스 변경 여부
+
+    @staticmethod
+    def digest(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest
+
+    def _read_index(self) -> dict[str, str]:
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except Exception:
+            return {}
+        return {str(k): str(v) for k, v in data.items()} if isinstance(data, dict) else {}
+
+    def _write_index(self) -> None:
+        # 다른 프로세스가 그사이 추가한 URL을 잃지 않도록 디스크 내용과 합쳐서 쓴다 (지워진 객체를 가리키는 URL은 뺀다)
+        merged = {
+            url: digest
+            for url, digest in {**self._read_index(), **self._urls}.items()
+            if digest in self._objects or self._object_path(digest).exists()
+        }
+        self._urls = merged
+        tmp = self.index_path.with_name(f".{INDEX_FILENAME}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(merged, ensure_ascii=False, indent=2), encoding="utf-8")
+            os.replace(tmp, self.index_path)
+        except OSError as e:
+            logging.getLogger("auto_youtube.image_cache").warning("image_cache_index_write_fail err=%s", e)
+            tmp.unlink(missing_ok=True)
+
+    def _load(self) -> None:
+        if self._urls is None:
+            self._urls = self._read_index()
+        if self._objects is None:
+            entries = []
+            if self.objects_dir.exists():
+                for p in self.objects_dir.iterdir():
+                    if p.name.startswith("."):
+                        continue
+                    try:
+                        st = p.stat()
+                    except OSError:
+                        continue
+                    entries.append((st.st_mtime, p.name, st.st_size))
+            entries.sort()
+            self._objects = OrderedDict((k, size) for _, k, size in entries)
+
+    def get(self, url: str) -> Path | None:
+        """캐시된 URL이면 객체 파일 경로 (없거나 지워졌으면 None)"""
+        with self._lock:
+            self._load()
+            digest = self._urls.get(url)
+            if digest is None:
+                # 다른 프로세스가 방금 받은 URL일 수 있다
+                digest = self._read_index().get(url)
+                if digest is not None:
+                    self._urls[url] = digest
+        path = self._object_path(digest) if digest else None
+        try:
+            if path is None:
+                raise FileNotFoundError(url)
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self.counters["misses"] += 1
+            return None
+
+        with self._lock:
+            self.counters["hits"] += 1
+            if digest in self._objects:
+                self._objects.move_to_end(digest)
+            else:
+                self._objects[digest] = path.stat().st_size
+        return path
+
+    def put(self, url: str, data: bytes) -> Path | None:
+        """다운로드한 바이트를 저장하고 객체 경로를 반환 (쓰기 실패 시 None)"""
+        digest = self.digest(data)
+        path = self._object_path(digest)
+        if not path.exists():
+            tmp = path.with_name(f".{digest}.{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                self.objects_dir.mkdir(parents=True, exist_ok=True)
+                tmp.write_bytes(data)
+                os.replace(tmp, path)
+            except OSError as e:
+                logging.getLogger("auto_youtube.image_cache").warning(
+                    "image_cache_write_fail url=%s path=%s err=%s", url, path, e
+                )
+                tmp.unlink(missing_ok=True)
+                return None
+
+        with self._lock:
+            self._load()
+            self.counters["writes"] += 1
+            self._objects[digest] = len(data)
+            self._objects.move_to_end(digest)
+            self._urls[url] = digest
+            self._evict(keep=digest)
+            self._dirty = True
+        return path
+
+    def flush(self) -> None:
+        """put()으로 쌓인 인덱스 변경을 index.json에 한 번에 반영한다"""
+        with self._lock:
+            if not self._dirty:
+                return
+            self._write_index()
+            self._dirty = False
+
+    def link_to(self, obj: Path, dest: Path) -> None:
+        """객체를 dest에 하드링크 (불가능하면 복사). dest가 이미 있으면 교체"""
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.unlink(missing_ok=True)
+        try:
+            os.link(obj, dest)
+            key = "linked"
+        except OSError:
+            shutil.copyfile(obj, dest)
+            key = "copied"
+        with self._lock:
+            self.counters[key] += 1
+
+    def _evict(self, keep: str) -> None:
+        total = sum(self._objects.values())
+        for digest in list(self._objects):
+            if total <= self.max_bytes:
+                break
+            # 방금 넣은 객체는 예산을 넘어도 남긴다 (호출자가 바로 링크하므로)
+            if digest == keep:
+                continue
+            total -= self._objects.pop(digest)
+            try:
+                self._object_path(digest).unlink()
+                self.counters["evicted"] += 1
+            except FileNotFoundError:
+                pass
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            self._load()
+            return {**self.counters, "objects": len(self._objects), "bytes": sum(self._objects.values())}
+
+
+_store: ImageStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_image_store() -> ImageStore | None:
+    """settings 기반 프로세스 전역 이미지 저장소 (IMAGE_CACHE_ENABLED=False면 None)"""
+    global _store
+    if not bool(getattr(settings, "IMAGE_CACHE_ENABLED", True)):
+        return None
+    with _store_lock:
+        if _store is None:
+            root = Path(getattr(settings, "IMAGE_CACHE_DIR", Path(settings.OUTPUT_DIR) / "image_cache"))
+            max_mb = float(getattr(settings, "IMAGE_CACHE_MAX_MB", 1024))
+            _store = ImageStore(root, int(max_mb * 1024 * 1024))
+            # download_images 밖(SlidePool/단건 다운로드)에서 쌓인 변경도 종료 시 남긴다
+            atexit.register(_store.flush)
+        return _store
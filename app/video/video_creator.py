@@ -1,18 +1,42 @@
 import logging
 import math
+from functools import partial
 from pathlib import Path
 
-from moviepy.editor import ImageClip, AudioFileClip, CompositeVideoClip, concatenate_videoclips
-from PIL import Image, ImageDraw, ImageFont
-import requests
-from io import BytesIO
+from moviepy.editor import CompositeVideoClip
+from PIL import Image, ImageDraw
 import numpy as np
+from app.render.engine import render_timeline
+from app.render.bgm import prepare_bgm
+from app.render.fonts import get_font
+from app.render.metrics import RenderMetrics, moviepy_frame_count
+from app.render.profile import get_profile
+from app.render.slides import get_slide_pool
+from app.render.text_draw import draw_outlined_text, outline_padding
+from app.render.text_metrics import get_measure
+from app.render.kenburns import configured_zoom, ken_burns_for, source_size
+from app.render.moviepy_clips import overlay_clip, slideshow_clip
+from app.render.overlay_cache import cached_overlay, log_overlay_cache_stats, overlay_cache_stats, stats_delta
+from app.render.timeline import LazyOverlay, OverlayLRU, Slide, Timeline
+from app.render.transitions import configured_transition
 from config import settings
 
-def create_long_video(script_text, image_urls, output_path=None):
+def create_long_video(
+    script_text,
+    image_urls,
+    output_path=None,
+    profile: str | None = None,
+    run_dir: str | Path | None = None,
+):
+    """run_dir가 있으면 단계별 시간/카운트를 run_dir/render_metrics.json의 "long_video"에 남긴다"""
     logger = logging.getLogger("auto_youtube.video.long")
     if output_path is None:
         output_path = str(settings.LONG_VIDEO_PATH)
+    metrics = RenderMetrics("long_video")
+
+    # 인코딩 프로파일(draft/publish/archive): 해상도 배율, fps, x264 옵션
+    prof = get_profile(profile)
+    resolution = prof.resolution(settings.LONG_VIDEO_RESOLUTION)
 
     target_duration = int(getattr(settings, "LONG_DURATION_SEC", 300))
     image_duration = int(getattr(settings, "LONG_IMAGE_DURATION_SEC", 3))
@@ -20,11 +44,13 @@ def create_long_video(script_text, image_urls, output_path=None):
         image_duration = 3
 
     logger.info(
-        "start output=%s target_duration=%ss image_duration=%ss urls=%s",
+        "start output=%s target_duration=%ss image_duration=%ss urls=%s profile=%s resolution=%s",
         output_path,
         target_duration,
         image_duration,
         len(image_urls) if image_urls else 0,
+        prof.name,
+        resolution,
     )
 
     if not image_urls:
@@ -37,71 +63,112 @@ def create_long_video(script_text, image_urls, output_path=None):
 
     url_cycle = [image_urls[i % len(image_urls)] for i in range(required_clips)]
 
-    # URL별 다운로드 캐시(같은 URL 반복 다운로드 방지)
-    cache: dict[str, np.ndarray] = {}
-    clips = []
+    # 프로세스 전역 이미지 풀: 같은 URL 반복 + 숏츠 등 다른 포맷과 원본 디코드를 공유
+    pool = get_slide_pool()
+    # Ken Burns: 줌 배율만큼 오버샘플한 원본을 한 번 로드해 두고 프레임마다 crop 창만 리샘플
+    zoom = configured_zoom()
+    load_size = source_size(resolution, zoom) if zoom else resolution
+    frames: list[np.ndarray] = []
     ok = 0
     fail = 0
-    headers = {"User-Agent": "auto-youtube/1.0"}
+    pool_before = pool.stats()
 
-    for idx, url in enumerate(url_cycle):
-        try:
-            if url not in cache:
+    with metrics.phase("load_images"):
+        for idx, url in enumerate(url_cycle):
+            try:
                 logger.debug("load_image idx=%s src=%s", idx, url)
-                # 로컬 파일이면 그대로 사용, 아니면 URL 다운로드
-                p = Path(str(url))
-                if p.exists():
-                    img = Image.open(str(p)).convert("RGB")
-                else:
-                    r = requests.get(url, timeout=15, headers=headers)
-                    r.raise_for_status()
-                    img = Image.open(BytesIO(r.content)).convert("RGB")
-                img = img.resize(settings.LONG_VIDEO_RESOLUTION)
-                cache[url] = np.array(img)
-            img_np = cache[url]
-            clips.append(ImageClip(img_np).set_duration(image_duration))
-            ok += 1
-        except Exception as e:
-            fail += 1
-            logger.exception("image_fail idx=%s url=%s err=%s", idx, url, e)
-
-    if not clips:
+                # 로컬 파일이면 그대로 사용, 아니면 URL 다운로드 (목표 해상도 근처로 디코드 + 크롭)
+                frames.append(pool.load(url, load_size))
+                ok += 1
+            except Exception as e:
+                fail += 1
+                logger.exception("image_fail idx=%s url=%s err=%s", idx, url, e)
+    metrics.record_images(len(url_cycle), ok, stats_delta(pool.stats(), pool_before))
+
+    if not frames:
         raise RuntimeError("No valid images to build video (all downloads/decodes failed)")
 
-    slideshow = concatenate_videoclips(clips, method="compose")
-    logger.info("slideshow duration=%ss ok=%s fail=%s unique_images=%s", slideshow.duration, ok, fail, len(cache))
+    slideshow_duration = len(frames) * image_duration
+    logger.info("slideshow duration=%ss ok=%s fail=%s unique_images=%s", slideshow_duration, ok, fail, len(set(url_cycle)))
+    logger.info("slide_pool %s", pool.stats())
 
     # --------- 자막을 '전체 스크립트 1장'이 아닌, 구간별로 분할 ---------
     segments = split_text(script_text, max_chars=48)
     if not segments:
         segments = [""]
 
-    seg_duration = slideshow.duration / len(segments)
+    seg_duration = slideshow_duration / len(segments)
     logger.info("subtitle_segments=%s seg_duration=%.2fs", len(segments), seg_duration)
 
-    subtitle_clips = []
-    for i, seg in enumerate(segments):
-        start = i * seg_duration
-        img_np = make_subtitle_image(
-            text=seg,
-            canvas_size=settings.LONG_VIDEO_RESOLUTION,
-            font_path=str(settings.FONT_PATH) if hasattr(settings, "FONT_PATH") else None,
-            font_size=settings.LONG_FONT_SIZE,
-            max_lines=3,
-            box_height_ratio=0.28,
-        )
-        subtitle_clips.append(
-            ImageClip(img_np).set_start(start).set_duration(seg_duration)
+    # 자막 이미지는 미리 만들지 않고, 타임라인이 해당 구간에 도달했을 때 렌더 (작은 LRU에만 보관)
+    # 렌더 결과는 디스크 캐시(overlay_cache)에도 남겨 다음 실행에서 같은 자막을 재사용
+    overlay_before = overlay_cache_stats()
+    subtitle_lru = OverlayLRU(int(getattr(settings, "SUBTITLE_LRU_SIZE", 2)))
+    subtitles = [
+        LazyOverlay(
+            partial(
+                cached_overlay,
+                make_subtitle_image,
+                settings_keys=("LONG_TEXT_OUTLINE_WIDTH",),
+                text=seg,
+                canvas_size=resolution,
+                font_path=str(settings.FONT_PATH) if hasattr(settings, "FONT_PATH") else None,
+                font_size=prof.font_size(settings.LONG_FONT_SIZE),
+                max_lines=3,
+                box_height_ratio=0.28,
+            ),
+            i * seg_duration,
+            seg_duration,
+            subtitle_lru,
         )
+        for i, seg in enumerate(segments)
+    ]
+
+    # BGM: 디코드/정규화/볼륨/길이 맞춤은 BGM 파일당 한 번 (캐시된 트랙을 그대로 mux)
+    with metrics.phase("bgm"):
+        bgm = prepare_bgm(settings.BGM_PATH, slideshow_duration, volume=float(getattr(settings, "BGM_VOLUME", 0.2)))
+    slides = [
+        Slide(f, image_duration, motion=ken_burns_for(i, zoom) if zoom else None)
+        for i, f in enumerate(frames)
+    ]
+    # 슬라이드 경계 전환: 전환 구간 프레임만 블렌드하고 나머지 정지 구간은 그대로
+    transition = configured_transition()
 
-    if settings.BGM_PATH.exists():
-        bgm = AudioFileClip(str(settings.BGM_PATH)).volumex(0.2)
-        final = CompositeVideoClip([slideshow, *subtitle_clips])
-        final.audio = bgm
-    else:
-        final = CompositeVideoClip([slideshow, *subtitle_clips])
+    engine = str(getattr(settings, "RENDER_ENGINE", "moviepy"))
+    logger.info("render engine=%s", engine)
 
-    final.write_videofile(output_path, fps=settings.VIDEO_FPS)
+    with metrics.phase("render"):
+        if engine != "moviepy":
+            timeline = Timeline(
+                size=resolution,
+                slides=slides,
+                overlays=subtitles,
+                transition=transition,
+            )
+            render_timeline(
+                timeline,
+                output_path,
+                fps=prof.video_fps,
+                audio=bgm,
+                engine=engine,
+                profile=prof,
+                metrics=metrics,
+            )
+        else:
+            slideshow = slideshow_clip(slides, resolution, transition)
+            subtitle_clips = [overlay_clip(o, resolution) for o in subtitles]
+
+            final = CompositeVideoClip([slideshow, *subtitle_clips])
+            # audio=파일 경로면 moviepy가 오디오를 다시 만들지 않고 -acodec copy로 mux 한다
+            final.write_videofile(output_path, audio=bgm.path if bgm else False, **prof.moviepy_kwargs())
+            # moviepy는 모든 프레임을 합성/인코딩한다
+            n = moviepy_frame_count(final.duration, prof.video_fps)
+            metrics.add("frames_composited", n)
+            metrics.add("frames_encoded", n)
+
+    log_overlay_cache_stats(logger, overlay_before)
+    metrics.record_overlays(len(subtitles), stats_delta(overlay_cache_stats(), overlay_before))
+    metrics.finish(output_path, run_dir)
     return output_path
 
 def split_text(text: str, max_chars: int = 48) -> list[str]:
@@ -155,51 +222,32 @@ def make_subtitle_image(
     bg_alpha: int = 160,
     max_lines: int = 3,
     box_height_ratio: float = 0.28,
-) -> np.ndarray:
+) -> tuple[np.ndarray, tuple[int, int]]:
     """
     ImageMagick 없이 자막을 이미지로 만든다.
     - canvas_size: (width, height)
     - font_path: ttf 경로 (없으면 기본 폰트)
     - bg_alpha: 자막 배경 반투명(0~255)
+    - 반환: (하단 박스 영역만 담은 RGBA, 캔버스 기준 배치 위치 (x, y))
+      전체 캔버스 RGBA는 대부분 투명이라 박스 영역만 들고 다닌다.
     """
     w, h = canvas_size
-    img = Image.new("RGBA", (w, h), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
 
     # 폰트 로드
-    if font_path:
-        try:
-            font = ImageFont.truetype(font_path, font_size)
-        except Exception:
-            font = ImageFont.load_default()
-    else:
-        font = ImageFont.load_default()
+    font = get_font(font_path, font_size)
 
     # 간단한 줄바꿈 래핑(너무 길면 여러 줄)
-    # 대략적인 글자 폭 기준으로 나눔 (정교하게 하려면 measure 기반으로 개선 가능)
+    # 글자 폭은 TextMeasure(글자 advance + 쌍 커닝 캐시)로 잰다
     max_width = w - margin * 2
 
+    measure = get_measure(font)
     lines = []
     for raw_line in text.split("\n"):
-        words = raw_line.split(" ")
-        cur = ""
-        for word in words:
-            test = (cur + " " + word).strip()
-            tw = draw.textlength(test, font=font)
-            if tw <= max_width:
-                cur = test
-            else:
-                if cur:
-                    lines.append(cur)
-                cur = word
-        if cur:
-            lines.append(cur)
+        lines.extend(measure.wrap_words(raw_line, max_width))
 
     # 하단 고정 박스 안에만 자막을 그린다 (전체 화면 덮임 방지)
     box_h = int(h * box_height_ratio)
     box_top = h - box_h
-    bg = Image.new("RGBA", (w, box_h), (0, 0, 0, bg_alpha))
-    img.paste(bg, (0, box_top))
 
     # 라인 수 제한 + 말줄임
     if max_lines and len(lines) > max_lines:
@@ -214,15 +262,18 @@ def make_subtitle_image(
     x = margin
     y = box_top + max(0, (box_h - text_block_h) // 2)
 
-    # 글자 그리기(흰색 + 검은색 외곽선 느낌을 간단히 구현)
-    for i, line in enumerate(lines):
-        yy = y + i * line_height
+    # 박스 + 글자(외곽선 포함)가 닿을 수 있는 세로 범위만 이미지로 만든다
+    outline_width = int(getattr(settings, "LONG_TEXT_OUTLINE_WIDTH", 2))
+    top = max(0, min(box_top, y - outline_padding(outline_width)))
+    img = Image.new("RGBA", (w, h - top), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    bg = Image.new("RGBA", (w, box_h), (0, 0, 0, bg_alpha))
+    img.paste(bg, (0, box_top - top))
 
-        # outline
-        for ox, oy in [(-2,0),(2,0),(0,-2),(0,2),(-2,-2),(2,2),(-2,2),(2,-2)]:
-            draw.text((x+ox, yy+oy), line, font=font, fill=(0,0,0,255))
-        # main
-        draw.text((x, yy), line, font=font, fill=(255,255,255,255))
+    # 글자 그리기(흰색 + 검은색 외곽선, stroke 한 번으로)
+    for i, line in enumerate(lines):
+        yy = y - top + i * line_height
+        draw_outlined_text(draw, (x, yy), line, font, outline_width=outline_width)
 
     # RGBA로 반환해야 투명도가 유지되어 이미지가 검게 덮이지 않는다.
-    return np.array(img)
\ No newline at end of file
+    return np.array(img), (0, top)
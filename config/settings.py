@@ -45,11 +45,21 @@ QUOTE_HOLD_SEC = 1.5
 # ======================
 # 무료 이미지 provider 우선순위 (fallback)
 IMAGE_PROVIDER_PRIORITY = ["unsplash", "pexels", "pixabay"]
+# provider 검색 결과(URL 목록) 캐시 (OUTPUT_DIR/image_search_cache.json)
+# - TTL 안이면 API를 부르지 않고, TTL 후 STALE_SEC 동안은 캐시 결과를 먼저 쓰고 백그라운드에서 갱신
+# - Unsplash 무료 티어는 시간당 50회라 길게 잡는다
+IMAGE_SEARCH_CACHE_ENABLED = True
+IMAGE_SEARCH_CACHE_TTL_SEC = {"unsplash": 60 * 60 * 24 * 3, "pexels": 60 * 60 * 24, "pixabay": 60 * 60 * 24, "default": 60 * 60 * 24}
+IMAGE_SEARCH_CACHE_STALE_SEC = 60 * 60 * 24 * 7
 
 # "유니크 이미지"를 몇 장 찾아올지 (롱폼은 여기서 가져온 이미지를 영상 길이(5분)에 맞춰 반복 재사용)
 LONG_IMAGE_COUNT = 12
 SHORT_IMAGE_COUNT = 3
 
+# 검색된 이미지 URL을 동시에 받을 스레드 수 (공유 HTTP 세션 위에서, 1이면 순차, LONG_IMAGE_COUNT 이상이면 한 번에 전부)
+# HTTP 커넥션 풀도 이 크기로 잡는다
+IMAGE_DOWNLOAD_WORKERS = 12
+
 # 숏츠에서 이미지 전환 주기(초)
 SHORT_IMAGE_DURATION_SEC = 2
 
@@ -85,10 +95,89 @@ LONG_DURATION_SEC = 100
 
 BGM_PATH = BASE_DIR / "assets" / "bgm" / "Nebula - The Grey Room _ Density & Time.mp3"
 FONT_PATH = BASE_DIR / "assets" / "font" / "NanumGothic.ttf"
+BGM_VOLUME = 0.2
+# BGM은 한 번만 디코드해서 (정규화 + 볼륨 적용) OUTPUT_DIR/bgm_cache에 두고 영상 길이에 맞춰 반복/자른 트랙을 재사용
+BGM_NORMALIZE = True
+BGM_LOUDNESS_LUFS = -14.0  # 정규화 목표 (볼륨 적용 전)
+BGM_SAMPLE_RATE = 44100
 
 # Text (기본값만)
 LONG_FONT_SIZE = 42
 SHORT_FONT_SIZE = 70
+# 프로세스 전역 폰트 캐시에 보관할 (path, size) 조합 수 (자막 크기 자동 축소 범위를 넉넉히 덮도록)
+FONT_CACHE_SIZE = 64
+# 글자 외곽선(stroke) 두께(px) - 롱폼 자막 / 숏츠·명언 텍스트
+LONG_TEXT_OUTLINE_WIDTH = 2
+SHORT_TEXT_OUTLINE_WIDTH = 3
+
+# ======================
+# Render Policy
+# ======================
+# 슬라이드 이미지 맞춤 방식
+# - "cover": 비율 유지 + 가운데 크롭 (인물이 늘어나지 않음)
+# - "stretch": 예전 방식(비율 무시하고 해상도로 resize)
+SLIDE_FIT = "cover"
+# 리샘플 필터: "nearest" | "box" | "bilinear" | "hamming" | "bicubic" | "lanczos"
+SLIDE_RESAMPLE = "bicubic"
+
+# 롱폼/숏츠 슬라이드 움직임
+# - "kenburns": 슬라이드마다 천천히 줌 인/아웃 + 팬 (오버샘플 원본에서 NumPy로 crop 리샘플)
+# - "none": 정지 슬라이드 (기본값 - 정지 구간 합성 캐시/still 세그먼트 인코딩이 그대로 적용된다)
+# kenburns는 모든 구간이 프레임마다 다시 합성되므로 렌더 시간이 몇 배 늘어난다 (opt-in)
+SLIDE_MOTION = "none"
+# Ken Burns 최대 줌 배율 (원본은 출력 해상도 x 이 배율로 디코드)
+KEN_BURNS_ZOOM = 1.12
+# 슬라이드 경계 전환
+# - "crossfade": 이전/다음 슬라이드 알파 블렌드
+# - "wipe": 다음 슬라이드가 오른쪽에서 미끄러져 들어와 덮음
+# - "none": 하드 컷 (기본값 - 기존 출력 그대로, opt-in으로만 전환 사용)
+SLIDE_TRANSITION = "none"
+# 전환 길이(초) - 다음 슬라이드 시작부터 이 시간 동안 섞는다 (영상 전체 길이는 그대로)
+SLIDE_TRANSITION_SEC = 0.5
+# 롱폼/숏츠 렌더 엔진
+# - "moviepy": 기존 moviepy 클립 트리(CompositeVideoClip -> write_videofile)
+# - "pipe": 프레임 제너레이터에서 raw RGB를 ffmpeg 파이프로 바로 인코딩 (moviepy 합성 없음)
+# - "segments": 화면이 안 바뀌는 구간마다 합성 1번 + still 세그먼트 인코딩, ffmpeg concat으로 연결
+RENDER_ENGINE = "moviepy"
+# 명언 숏츠 렌더 엔진 (RENDER_ENGINE과 따로 정한다)
+# 화면이 토큰 경계에서만 바뀌므로 "segments"면 이벤트 수만큼만 인코딩한다 (moviepy는 길이 x fps 프레임 전부)
+QUOTE_RENDER_ENGINE = "segments"
+
+# 자막 이미지는 타임라인이 도달했을 때 렌더하고 이 개수만큼만 메모리에 둔다 (현재 + 다음)
+SUBTITLE_LRU_SIZE = 2
+# 롱폼/숏츠가 공유하는 디코드 이미지 풀 메모리 상한(MB) (원본 디코드 + 해상도별 슬라이드, 오래 안 쓴 것부터 제거)
+SLIDE_POOL_MAX_MB = 512
+# 렌더된 자막 오버레이 PNG 디스크 캐시 (OUTPUT_DIR/overlay_cache, 같은 문구/폰트/캔버스면 실행 간 재사용)
+# 용량(MB)을 넘으면 가장 오래 안 쓴 것부터 지운다
+OVERLAY_CACHE_ENABLED = True
+OVERLAY_CACHE_MAX_MB = 256
+
+# 다운로드한 이미지를 OUTPUT_DIR/image_cache에 내용 해시로 저장해서 실행 간 재사용 (URL -> 해시 인덱스)
+# 실행별 images 폴더에는 하드링크, 용량(MB)을 넘으면 가장 오래 안 쓴 것부터 지운다
+IMAGE_CACHE_ENABLED = True
+IMAGE_CACHE_MAX_MB = 1024
+
+# pipe/segments 엔진: (슬라이드, 자막) 조합별 합성 프레임 LRU 크기(장)
+RENDER_COMPOSITE_CACHE_SIZE = 8
+
+# pipe/segments 엔진: 타임라인을 슬라이드 경계로 나눠 병렬 인코딩할 워커 프로세스 수 (1이면 단일 프로세스)
+RENDER_WORKERS = 1
+
+# ======================
+# Encoding Profiles
+# ======================
+# 실행마다 main.py --profile 로 선택 (롱폼/숏츠/명언 숏츠 공통)
+# - preset/crf/tune/threads: libx264 옵션 (threads=0 은 ffmpeg 자동)
+# - scale: 해상도 배율 (LONG/SHORT_VIDEO_RESOLUTION 기준), fps: None이면 VIDEO_FPS
+ENCODE_PROFILES = {
+    # 편집자 미리보기용: 절반 해상도 + 15fps + ultrafast
+    "draft": {"preset": "ultrafast", "crf": 30, "tune": "stillimage", "threads": 0, "scale": 0.5, "fps": 15},
+    # 업로드용 기본값
+    "publish": {"preset": "medium", "crf": 23, "tune": "stillimage", "threads": 0, "scale": 1.0, "fps": None},
+    # 보관용 고화질
+    "archive": {"preset": "slow", "crf": 18, "tune": "stillimage", "threads": 0, "scale": 1.0, "fps": None},
+}
+ENCODE_PROFILE = "publish"
 
 # ======================
 # Logging Policy
@@ -10,8 +10,18 @@ from config import settings
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--pipeline", default="crime")
+    parser.add_argument(
+        "--profile",
+        default=None,
+        choices=sorted(settings.ENCODE_PROFILES),
+        help=f"인코딩 프로파일 (기본: {settings.ENCODE_PROFILE})",
+    )
     args = parser.parse_args()
 
+    # 이번 실행의 인코딩 프로파일 (롱폼/숏츠/명언 숏츠 렌더러가 settings에서 읽는다)
+    if args.profile:
+        settings.ENCODE_PROFILE = args.profile
+
     level = getattr(logging, str(settings.LOG_LEVEL).upper(), logging.INFO)
     setup_logger("auto_youtube", level=level, force=True)
 